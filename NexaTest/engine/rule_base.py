@@ -4,11 +4,21 @@ class Rule(ABC):
     id = "BASE_RULE"
     severity = "warning"
 
+    # (code, lines) for the most recent source; the engine passes the same
+    # string to every rule, so it is only split and stripped once per file
+    _lines_cache = (None, None)
+
     def get_lines(self, code: str):
-        return [
+        cached_code, cached_lines = Rule._lines_cache
+        if cached_code is code:
+            return cached_lines
+
+        lines = [
             (i + 1, line, line.strip())
             for i, line in enumerate(code.splitlines())
         ]
+        Rule._lines_cache = (code, lines)
+        return lines
 
     @abstractmethod
     def evaluate(self, code: str):
@@ -15,12 +15,14 @@ def load_config():
     with open(config_path, "r") as f:
         return json.load(f)
 
-def analyze_file(file_path):
+def analyze_file(file_path, code=None):
     """
     Analyzes a single python file and returns a report dictionary.
+    Pass `code` when the caller has already read the file to skip reading it again.
     """
-    with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
-        code = f.read()
+    if code is None:
+        with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
+            code = f.read()
 
     config = load_config()
 
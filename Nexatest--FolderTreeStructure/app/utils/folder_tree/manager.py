@@ -95,7 +95,10 @@ class FolderTreeManager:
             base = _resolve_path(base_path)
         else:
             base = Path(base_path)
+        return self._create_tree(base, structure, overwrite, dry_run)
 
+    def _create_tree(self, base: Path, structure: TreeStructure, overwrite: bool, dry_run: bool) -> Dict[str, Any]:
+        # base is already resolved, so child paths built from it are used as-is
         if not dry_run:
             try:
                 self.adapter.mkdir(base, parents=True, exist_ok=True)
@@ -131,7 +134,7 @@ class FolderTreeManager:
                     raise FolderTreeError(f"Failed to create {current_path}: {e}")
 
             if is_folder:
-                sub_results = self.create_folder_tree(current_path, value, overwrite, dry_run)
+                sub_results = self._create_tree(current_path, value, overwrite, dry_run)
                 result_paths[key] = sub_results
             else:
                 result_paths[key] = current_path
@@ -1,10 +1,29 @@
 import pytest
 import logging
+import logging.handlers
 from unittest.mock import MagicMock
 from pathlib import Path
 from app.utils.folder_tree.manager import FolderTreeManager
 from app.utils.folder_tree.exceptions import FolderTreeError, ValidationError, MigrationError
 
+@pytest.fixture(scope="module", autouse=True)
+def _capture():
+    # One handler for the whole module instead of caplog's per-test install
+    handler = logging.handlers.BufferingHandler(capacity=1024)
+    handler.setLevel(logging.WARNING)
+    logger = logging.getLogger("app.utils.folder_tree")
+    logger.addHandler(handler)
+    yield handler
+    logger.removeHandler(handler)
+
+@pytest.fixture
+def log_records(_capture):
+    _capture.buffer.clear()
+    return _capture.buffer
+
+def _messages(records):
+    return "\n".join(r.getMessage() for r in records)
+
 @pytest.fixture
 def mock_adapter():
     return MagicMock()
@@ -23,10 +42,9 @@ def test_validate_folder_tree_base_exists_error(manager, mock_adapter):
     with pytest.raises(FolderTreeError, match="Base path does not exist"):
         manager.validate_folder_tree("/base", {})
 
-def test_cleanup_no_confirm(manager, caplog):
-    with caplog.at_level(logging.WARNING):
-        manager.cleanup_folder_tree("/base", {}, confirm=False)
-    assert "called without confirm=True" in caplog.text
+def test_cleanup_no_confirm(manager, log_records):
+    manager.cleanup_folder_tree("/base", {}, confirm=False)
+    assert "called without confirm=True" in _messages(log_records)
 
 def test_migrate_source_not_found(manager, mock_adapter):
     mock_adapter.exists.return_value = False
@@ -52,9 +70,8 @@ def test_cleanup_with_underscore_keys(manager, mock_adapter):
     assert any("dir" in str(p) for p in called_paths)
     assert not any("_perms" in str(p) for p in called_paths)
 
-def test_cleanup_failure_logging(manager, mock_adapter, caplog):
+def test_cleanup_failure_logging(manager, mock_adapter, log_records):
     mock_adapter.exists.return_value = True
     mock_adapter.remove.side_effect = Exception("delete failed")
-    with caplog.at_level(logging.WARNING):
-        manager.cleanup_folder_tree("/base", {"dir": {}}, confirm=True)
-    assert "Could not delete" in caplog.text
+    manager.cleanup_folder_tree("/base", {"dir": {}}, confirm=True)
+    assert "Could not delete" in _messages(log_records)
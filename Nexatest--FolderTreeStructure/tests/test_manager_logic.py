@@ -4,6 +4,11 @@ from pathlib import Path
 from app.utils.folder_tree.manager import FolderTreeManager
 from app.utils.folder_tree.adapters import BaseStorageAdapter
 
+BASE = Path("/mock/base")
+DIR1 = BASE / "dir1"
+FILE1 = DIR1 / "file1.txt"
+FILE2 = BASE / "file2.txt"
+
 @pytest.fixture
 def mock_adapter():
     return MagicMock(spec=BaseStorageAdapter)
@@ -19,26 +24,25 @@ def test_create_folder_tree_logic(manager, mock_adapter):
         },
         "file2.txt": "content2"
     }
-    base_path = Path("/mock/base")
     mock_adapter.exists.return_value = False
     
-    manager.create_folder_tree(base_path, structure)
+    manager.create_folder_tree(BASE, structure)
     
     # Check if adapter methods were called correctly
-    mock_adapter.mkdir.assert_any_call(base_path, parents=True, exist_ok=True)
-    mock_adapter.mkdir.assert_any_call(base_path / "dir1", parents=True, exist_ok=True)
-    mock_adapter.write_file.assert_any_call(base_path / "dir1" / "file1.txt", "content1", overwrite=False)
-    mock_adapter.write_file.assert_any_call(base_path / "file2.txt", "content2", overwrite=False)
+    mock_adapter.mkdir.assert_any_call(BASE, parents=True, exist_ok=True)
+    mock_adapter.mkdir.assert_any_call(DIR1, parents=True, exist_ok=True)
+    mock_adapter.write_file.assert_any_call(FILE1, "content1", overwrite=False)
+    mock_adapter.write_file.assert_any_call(FILE2, "content2", overwrite=False)
 
 def test_validate_folder_tree_logic(manager, mock_adapter):
     structure = {"a": {"b": {}}}
-    base_path = Path("/mock/base")
+    existing = {BASE, BASE / "a"}
     
-    mock_adapter.exists.side_effect = lambda p: p in [base_path, base_path / "a"]
+    mock_adapter.exists.side_effect = lambda p: p in existing
     
     from app.utils.folder_tree.exceptions import ValidationError
     with pytest.raises(ValidationError, match="Missing 1 folders"):
-        manager.validate_folder_tree(base_path, structure)
+        manager.validate_folder_tree(BASE, structure)
 
 def test_migrate_logic(manager, mock_adapter):
     src = Path("/src")
@@ -53,9 +57,8 @@ def test_migrate_logic(manager, mock_adapter):
 
 def test_dry_run_logic(manager, mock_adapter):
     structure = {"dir": {}}
-    base_path = Path("/mock/base")
     
-    manager.create_folder_tree(base_path, structure, dry_run=True)
+    manager.create_folder_tree(BASE, structure, dry_run=True)
     
     # Should NOT call adapter methods that modify state
     mock_adapter.mkdir.assert_not_called()
@@ -5,15 +5,41 @@ This module defines FastAPI dependencies, particularly for authentication and
 database session injection.
 """
 
+import hashlib
+
+import httpx
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
 from app.db.database import get_db
+from app.db.queries import USER_BY_GITHUB_ID
 from app.services.github_service import verify_access_token
+from app.services.readme_cache import TTLCache
 from app.models.user import User
 
 security = HTTPBearer()
 
+# Short-lived cache of GitHub token verification results, keyed by token hash.
+# Valid tokens map to the local user ID; rejected tokens map to NEG_SENTINEL so
+# repeated requests with a bad token fail without another GitHub round trip.
+# Bounded, so a client sending random tokens can't grow it without limit.
+TOKEN_CACHE_TTL = 300.0
+NEGATIVE_TOKEN_CACHE_TTL = 60.0
+TOKEN_CACHE_MAXSIZE = 4096
+NEG_SENTINEL = object()
+TOKEN_CACHE = TTLCache(maxsize=TOKEN_CACHE_MAXSIZE)
+
+def _token_hash(token: str) -> str:
+    """Returns the cache key for a token so raw tokens are never kept in memory."""
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+def _unauthorized(detail: str) -> HTTPException:
+    """Builds the 401 error raised for any authentication failure."""
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail=detail,
+    )
+
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: Session = Depends(get_db)
@@ -21,6 +47,9 @@ async def get_current_user(
     """
     Dependency that authenticates the user via GitHub token.
 
+    Verification results are cached per token, so only the first request
+    (or the first after expiry) pays the GitHub round trip.
+
     Args:
         credentials (HTTPAuthorizationCredentials): The bearer token.
         db (Session): The database session.
@@ -32,34 +61,48 @@ async def get_current_user(
         HTTPException: If the token is invalid or the user does not exist in the local DB.
     """
     token = credentials.credentials
-    
+    key = _token_hash(token)
+
+    cached = TOKEN_CACHE.get(key)
+    if cached is NEG_SENTINEL:
+        raise _unauthorized("Invalid GitHub token")
+    if cached is not None:
+        user = db.get(User, cached)
+        if user:
+            return user
+        # The user row disappeared since it was cached; verify again below.
+        TOKEN_CACHE.pop(key)
+
+    # Verify token with GitHub to ensure it is still valid
     try:
-        # Verify token with GitHub to ensure it is still valid
         github_user = await verify_access_token(token)
-        github_id = github_user.get("id")
-        
-        if not github_id:
-             raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid GitHub token",
-            )
-
-        # Fetch user from DB
-        user = db.query(User).filter(User.github_id == github_id).first()
-        
-        if not user:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="User not found",
-            )
-            
-        return user
-        
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Could not validate credentials",
-        )
+    except HTTPException as e:
+        # Only a rejected token is cached; a GitHub outage (429/5xx) must not stick.
+        if e.status_code == status.HTTP_401_UNAUTHORIZED:
+            TOKEN_CACHE.set(key, NEG_SENTINEL, NEGATIVE_TOKEN_CACHE_TTL)
+            raise _unauthorized("Invalid GitHub token")
+        if e.status_code == status.HTTP_429_TOO_MANY_REQUESTS:
+            # Rate-limited, not rejected: tell the client to retry rather than re-authenticate
+            raise HTTPException(status_code=status.HTTP_429_TOO_MANY_REQUESTS, detail=e.detail)
+        raise _unauthorized("Could not validate credentials")
+    except httpx.HTTPError:
+        # Network failure talking to GitHub: reject, but don't cache the outcome.
+        raise _unauthorized("Could not validate credentials")
+
+    github_id = github_user.get("id")
+    if not github_id:
+        TOKEN_CACHE.set(key, NEG_SENTINEL, NEGATIVE_TOKEN_CACHE_TTL)
+        raise _unauthorized("Invalid GitHub token")
+
+    # Fetch user from DB
+    user = db.execute(USER_BY_GITHUB_ID, {"gid": github_id}).scalar_one_or_none()
+
+    if not user:
+        # Not cached: the user may register via /auth/verify-token right after.
+        raise _unauthorized("User not found")
+
+    TOKEN_CACHE.set(key, user.id, TOKEN_CACHE_TTL)
+    return user
 
 # Re-export get_db for use in other modules
 __all__ = ["get_db", "get_current_user"]
@@ -9,6 +9,7 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
 from app.db.database import get_db
+from app.db.queries import USER_BY_GITHUB_ID
 from app.services.github_service import verify_access_token
 from app.models.user import User
 from app.schemas.user import UserResponse
@@ -52,7 +53,7 @@ async def verify_token(
         )
     
     # Check if user exists
-    user = db.query(User).filter(User.github_id == github_id).first()
+    user = db.execute(USER_BY_GITHUB_ID, {"gid": github_id}).scalar_one_or_none()
     
     if user:
         # Update existing user
@@ -5,16 +5,18 @@ This module handles project generation and management endpoints.
 It orchestrates the flow from repository selection to README parsing and project creation.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
 from sqlalchemy.orm import Session
-from app.db.database import get_db
+from app.db.database import SessionLocal, get_db
+from app.db.queries import REPO_FOR_USER
 from app.api.dependencies import get_current_user
 from app.models.user import User
 from app.models.repository import Repository
 from app.models.project import Project
-from app.schemas.project import ProjectResponse
+from app.schemas.project import GenerationTaskResponse, ProjectResponse
 from app.services.github_service import get_readme_content
 from app.services.readme_parser import parser
+from app.services import generation_tasks, readme_cache
 
 router = APIRouter()
 
@@ -48,11 +50,90 @@ async def generate_project_from_readme(
             - 502: GitHub API error.
             - 500: LLM parsing error.
     """
+    repo = _get_connected_repository(db, repository_id, current_user)
+    return await _build_project(db, repo, current_user)
+
+@router.post(
+    "/generate/{repository_id}/task",
+    response_model=GenerationTaskResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+def submit_project_generation(
+    repository_id: int,
+    background_tasks: BackgroundTasks,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Queue project generation for a connected repository and return immediately.
+
+    The README is fetched and parsed in the background; poll
+    GET /projects/generate/{task_id}/status for the result.
+
+    Args:
+        repository_id (int): The internal ID of the connected repository.
+        background_tasks (BackgroundTasks): FastAPI background task runner.
+        current_user (User): The authenticated user.
+        db (Session): Database session.
+
+    Returns:
+        GenerationTaskResponse: The queued task (status "pending").
+
+    Raises:
+        HTTPException:
+            - 404: Repository not found.
+            - 400: User missing GitHub token.
+    """
+    repo = _get_connected_repository(db, repository_id, current_user)
+    task_id = generation_tasks.create_task(current_user.id, repo.id)
+    background_tasks.add_task(_run_generation_task, task_id, repo.id, current_user.id)
+    return GenerationTaskResponse(task_id=task_id, status=generation_tasks.PENDING)
+
+@router.get("/generate/{task_id}/status", response_model=GenerationTaskResponse)
+def get_project_generation_status(
+    task_id: str,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Get the state of a queued project generation.
+
+    Args:
+        task_id (str): The ID returned by the submit endpoint.
+        current_user (User): The authenticated user.
+        db (Session): Database session.
+
+    Returns:
+        GenerationTaskResponse: The task status, with the project once completed
+            or the error message if it failed.
+    """
+    task = generation_tasks.get_task(task_id)
+    if not task or task["user_id"] != current_user.id:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Generation task not found"
+        )
+
+    project = db.get(Project, task["project_id"]) if task["project_id"] else None
+    return GenerationTaskResponse(
+        task_id=task_id,
+        status=task["status"],
+        project=project,
+        error=task["error"],
+    )
+
+def _get_connected_repository(db: Session, repository_id: int, current_user: User) -> Repository:
+    """
+    Loads a repository connected by the user and checks they can fetch its README.
+
+    Raises:
+        HTTPException: 404 if the repository isn't connected by this user,
+            400 if the user has no GitHub token.
+    """
     # 1. Fetch Repository
-    repo = db.query(Repository).filter(
-        Repository.id == repository_id,
-        Repository.connected_by_user_id == current_user.id
-    ).first()
+    repo = db.execute(
+        REPO_FOR_USER, {"rid": repository_id, "uid": current_user.id}
+    ).scalar_one_or_none()
 
     if not repo:
         raise HTTPException(
@@ -60,30 +141,47 @@ async def generate_project_from_readme(
             detail="Repository not found or not connected by this user."
         )
 
-    # 2. Extract README from GitHub
+    # 2. The README is fetched with the user's GitHub token
     if not current_user.github_access_token:
          raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="User has no GitHub access token",
             )
 
-    try:
-        readme_text = await get_readme_content(current_user.github_access_token, repo.full_name)
-    except Exception as e:
-        # Fallback for network/GitHub errors not handled in service
-        raise HTTPException(
-            status_code=status.HTTP_502_BAD_GATEWAY,
-            detail=f"Error fetching README: {str(e)}"
-        )
+    return repo
 
-    # 3. Parse with LLaMA-2 (now async via Ollama)
-    try:
-        extracted_data = await parser.parse_readme(readme_text)
-    except Exception as e:
-         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"LLM Parsing failed: {str(e)}"
-        )
+async def _build_project(db: Session, repo: Repository, current_user: User) -> Project:
+    """
+    Fetches and parses the repository README and stores the resulting Project.
+
+    Raises:
+        HTTPException: 502 on GitHub errors, 500 if LLM parsing fails.
+    """
+    # Repositories recently found without a README skip the GitHub call
+    readme_text = ""
+    if not readme_cache.is_readme_missing(repo.full_name):
+        try:
+            readme_text = await get_readme_content(current_user.github_access_token, repo.full_name)
+        except Exception as e:
+            # Fallback for network/GitHub errors not handled in service
+            raise HTTPException(
+                status_code=status.HTTP_502_BAD_GATEWAY,
+                detail=f"Error fetching README: {str(e)}"
+            )
+        if not readme_text:
+            readme_cache.mark_readme_missing(repo.full_name)
+
+    # 3. Parse with LLaMA-2 (now async via Ollama), reusing results for identical READMEs
+    extracted_data = readme_cache.get_extraction(readme_text)
+    if extracted_data is None:
+        try:
+            extracted_data = await parser.parse_readme(readme_text)
+        except Exception as e:
+             raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"LLM Parsing failed: {str(e)}"
+            )
+        readme_cache.store_extraction(readme_text, extracted_data)
     
     # Check if parsing effectively failed (e.g. invalid JSON led to empty defaults)
     # The requirement says: "If JSON parsing fails: Raise a controlled error... Do not store"
@@ -105,6 +203,28 @@ async def generate_project_from_readme(
 
     return new_project
 
+async def _run_generation_task(task_id: str, repository_id: int, user_id: int) -> None:
+    """
+    Runs a queued generation with its own database session, recording the outcome.
+
+    Args:
+        task_id (str): The generation task to update.
+        repository_id (int): The internal ID of the connected repository.
+        user_id (int): The user who submitted the task.
+    """
+    generation_tasks.update_task(task_id, status=generation_tasks.RUNNING)
+    with SessionLocal() as db:
+        try:
+            current_user = db.get(User, user_id)
+            repo = _get_connected_repository(db, repository_id, current_user)
+            project = await _build_project(db, repo, current_user)
+        except HTTPException as e:
+            generation_tasks.update_task(task_id, status=generation_tasks.FAILED, error=str(e.detail))
+        except Exception as e:
+            generation_tasks.update_task(task_id, status=generation_tasks.FAILED, error=str(e))
+        else:
+            generation_tasks.update_task(task_id, status=generation_tasks.COMPLETED, project_id=project.id)
+
 @router.get("/{project_id}", response_model=ProjectResponse)
 def get_project(
     project_id: int,
@@ -122,7 +242,7 @@ def get_project(
     Returns:
         ProjectResponse: The project details.
     """
-    project = db.query(Project).filter(Project.id == project_id).first()
+    project = db.get(Project, project_id)
     if not project:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -6,6 +6,8 @@ from GitHub and connecting them to the local application.
 """
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import JSONResponse
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 from typing import List, Dict, Any
 
@@ -30,6 +32,8 @@ async def list_user_repositories(
 
     Returns:
         List[Dict[str, Any]]: A list of repositories from GitHub.
+            Returned as a JSONResponse so the already-plain dicts skip
+            FastAPI's response_model re-validation.
     """
     if not current_user.github_access_token:
          raise HTTPException(
@@ -39,7 +43,7 @@ async def list_user_repositories(
             
     try:
         repos = await get_user_repositories(current_user.github_access_token)
-        return repos
+        return JSONResponse(content=repos)
     except Exception as e:
         # In a real app, we might want to log this error
         raise HTTPException(
@@ -72,7 +76,9 @@ async def connect_repository(
             )
 
     # Check if repository already exists in DB
-    existing_repo = db.query(Repository).filter(Repository.github_repo_id == repo_in.github_repo_id).first()
+    existing_repo = db.execute(
+        select(Repository).where(Repository.github_repo_id == repo_in.github_repo_id)
+    ).scalar_one_or_none()
     if existing_repo:
         return existing_repo
 
@@ -32,6 +32,14 @@ OLLAMA_API_URL = os.getenv("OLLAMA_API_URL", "http://localhost:11434/api/generat
 # Use the smaller 1.5b model to fit in tighter memory constraints (~1.1GB RAM)
 OLLAMA_MODEL = os.getenv("OLLAMA_MODEL", "deepseek-r1:1.5b")
 OLLAMA_TIMEOUT = float(os.getenv("OLLAMA_TIMEOUT", "300.0"))
+# How long Ollama keeps the model loaded after a request (avoids reloading between calls)
+OLLAMA_KEEP_ALIVE = os.getenv("OLLAMA_KEEP_ALIVE", "10m")
+# Maximum number of README parses sent to Ollama at once by parse_readmes()
+OLLAMA_MAX_CONCURRENCY = int(os.getenv("OLLAMA_MAX_CONCURRENCY", "4"))
+# Approximate token budget for the README excerpt included in the prompt (must be positive)
+README_MAX_TOKENS = int(os.getenv("README_MAX_TOKENS", "1500"))
+if README_MAX_TOKENS < 1:
+    raise ValueError(f"README_MAX_TOKENS must be a positive integer, got {README_MAX_TOKENS}")
 
 
 
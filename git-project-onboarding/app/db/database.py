@@ -4,14 +4,43 @@ Database Connection
 This module handles the database engine creation and session management.
 """
 
-from sqlalchemy import create_engine
+import orjson
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 from typing import Generator
 from app.core.config import DATABASE_URL
 
+def _json_serializer(value) -> str:
+    """Encodes JSON column values with orjson (int keys become strings, as with json)."""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+
 # Create the SQLAlchemy engine. 
 # check_same_thread=False is needed for SQLite, remove for Postgres/MySQL
-engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
+# JSON columns (Project.features, AnalysisResult.*) are encoded/decoded with orjson.
+engine = create_engine(
+    DATABASE_URL,
+    connect_args={"check_same_thread": False},
+    json_serializer=_json_serializer,
+    json_deserializer=orjson.loads,
+)
+
+if engine.url.get_backend_name() == "sqlite":
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        """
+        Tunes every new SQLite connection for concurrent reads.
+
+        WAL lets readers proceed while a writer commits, synchronous=NORMAL
+        drops the per-commit fsync (still safe in WAL mode), and the larger
+        page cache / mmap window keeps hot pages out of the read() path.
+        """
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA cache_size=-64000")
+        cursor.execute("PRAGMA mmap_size=268435456")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.close()
 
 # Create a customized Session class
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
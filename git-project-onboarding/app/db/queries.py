@@ -0,0 +1,34 @@
+"""
+Shared Queries
+
+This module defines the hot SELECT statements used by the API routes as
+module-level constants with bound parameters. Reusing the same statement
+objects lets SQLAlchemy's compiled-statement cache serve every request after
+the first, and `warm_statement_cache` compiles them at startup so the first
+request doesn't pay that cost either.
+"""
+
+from sqlalchemy import bindparam, select
+from sqlalchemy.orm import Session
+from app.models.user import User
+from app.models.repository import Repository
+
+# User lookup by GitHub ID. Params: gid
+USER_BY_GITHUB_ID = select(User).where(User.github_id == bindparam("gid"))
+
+# Repository lookup restricted to the user who connected it. Params: rid, uid
+REPO_FOR_USER = select(Repository).where(
+    Repository.id == bindparam("rid"),
+    Repository.connected_by_user_id == bindparam("uid"),
+)
+
+def warm_statement_cache(db: Session) -> None:
+    """
+    Executes each shared statement once with placeholder values so their
+    compiled forms are in the engine's cache before the first request.
+
+    Args:
+        db (Session): A database session bound to the application engine.
+    """
+    db.execute(USER_BY_GITHUB_ID, {"gid": -1}).first()
+    db.execute(REPO_FOR_USER, {"rid": -1, "uid": -1}).first()
@@ -5,20 +5,38 @@ This module initializes the FastAPI application, configures the database,
 and registers all the API routers.
 """
 
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from app.api.routes import auth, repos, projects
-from app.db.database import engine
+from app.db.database import engine, SessionLocal
+from app.db.queries import warm_statement_cache
+from app.services.github_service import close_client as close_github_client
+from app.services.readme_parser import parser as readme_parser
 from app.models import user, repository, project  # Import models to register them with Base
 from app.db.base import Base
 
-# Create database tables automatically on startup
-# In production, use Alembic for value migrations instead of this.
-Base.metadata.create_all(bind=engine)
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Runs one-time startup work and releases shared resources on shutdown."""
+    # Create database tables automatically on startup
+    # In production, use Alembic for value migrations instead of this.
+    Base.metadata.create_all(bind=engine)
+
+    # Compile the hot route queries now rather than on the first request
+    with SessionLocal() as db:
+        warm_statement_cache(db)
+
+    yield
+
+    # Close the pooled GitHub/Ollama clients and their keep-alive connections
+    await close_github_client()
+    await readme_parser.aclose()
 
 app = FastAPI(
     title="GitHub Project Generator API",
     description="API for parsing GitHub READMEs and generating project summaries using Ollama",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 @app.get("/")
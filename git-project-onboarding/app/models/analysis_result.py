@@ -30,4 +30,5 @@ class AnalysisResult(Base):
     python_files = Column(JSON)
     analysis_data = Column(JSON)
     
-    created_at = Column(DateTime, default=datetime.utcnow)
+    # Indexed so newest-first listings walk the index instead of sorting the JSON-heavy rows
+    created_at = Column(DateTime, default=datetime.utcnow, index=True)
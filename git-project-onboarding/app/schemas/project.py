@@ -4,8 +4,9 @@ Project Schemas
 This module defines the Pydantic models (data transfer objects) for Project-related operations.
 """
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, Field
 from typing import List, Optional
+from typing_extensions import Annotated, TypedDict
 from datetime import datetime
 
 class ProjectBase(BaseModel):
@@ -25,7 +26,22 @@ class ProjectResponse(ProjectBase):
     repository_id: int
     created_at: datetime
 
-    class Config:
-        """Pydantic configuration."""
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
+class GenerationTaskResponse(BaseModel):
+    """Pydantic model for reporting the state of a background project generation."""
+    task_id: str
+    status: str
+    project: Optional[ProjectResponse] = None
+    error: Optional[str] = None
+
+class ReadmeExtract(TypedDict):
+    """
+    Structured fields extracted from a README by the LLM parser.
+
+    Validated straight from the model's JSON output: unknown keys are dropped
+    and missing fields default to empty values.
+    """
+    project_name: Annotated[str, Field(default="")]
+    description: Annotated[str, Field(default="")]
+    features: Annotated[List[str], Field(default_factory=list)]
@@ -5,8 +5,9 @@ This module defines the Pydantic models for Repository-related operations,
 including data validation for connection requests and API responses.
 """
 
-from pydantic import BaseModel
+from pydantic import AliasPath, BaseModel, ConfigDict, Field
 from typing import Optional
+from typing_extensions import Annotated, TypedDict
 from datetime import datetime
 
 class RepositoryBase(BaseModel):
@@ -34,7 +35,21 @@ class RepositoryResponse(RepositoryBase):
     connected_by_user_id: int
     created_at: datetime
 
-    class Config:
-        """Pydantic configuration."""
-        from_attributes = True
-
+    model_config = ConfigDict(from_attributes=True)
+
+class GitHubRepoSummary(TypedDict):
+    """
+    Simplified GitHub repository entry returned by GET /repos/.
+
+    Validated straight from the GitHub /user/repos JSON body: unknown keys are
+    dropped and owner.login is flattened into owner_login. Missing fields
+    default to None (e.g. an empty repository has no default_branch), so one
+    incomplete entry doesn't fail the whole list.
+    """
+    id: Annotated[Optional[int], Field(default=None)]
+    name: Annotated[Optional[str], Field(default=None)]
+    full_name: Annotated[Optional[str], Field(default=None)]
+    html_url: Annotated[Optional[str], Field(default=None)]
+    private: Annotated[Optional[bool], Field(default=None)]
+    default_branch: Annotated[Optional[str], Field(default=None)]
+    owner_login: Annotated[Optional[str], Field(default=None, validation_alias=AliasPath("owner", "login"))]
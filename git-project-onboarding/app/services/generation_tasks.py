@@ -0,0 +1,67 @@
+"""
+Generation Task Store
+
+This module tracks project-generation jobs that run in the background, so the
+client can submit a README analysis and poll for the result instead of holding
+a request open for the whole LLM inference. State is kept in-process and
+expires after TASK_TTL seconds.
+"""
+
+import uuid
+from typing import Any, Dict, Optional
+from app.services.readme_cache import TTLCache
+
+TASK_TTL = 3600.0
+
+PENDING = "pending"
+RUNNING = "running"
+COMPLETED = "completed"
+FAILED = "failed"
+
+_tasks = TTLCache()
+
+def create_task(user_id: int, repository_id: int) -> str:
+    """
+    Registers a new pending generation task.
+
+    Args:
+        user_id (int): The user who submitted the task.
+        repository_id (int): The internal ID of the repository to analyse.
+
+    Returns:
+        str: The new task ID.
+    """
+    task_id = uuid.uuid4().hex
+    _tasks.set(task_id, {
+        "user_id": user_id,
+        "repository_id": repository_id,
+        "status": PENDING,
+        "project_id": None,
+        "error": None,
+    }, TASK_TTL)
+    return task_id
+
+def get_task(task_id: str) -> Optional[Dict[str, Any]]:
+    """
+    Looks up a generation task.
+
+    Args:
+        task_id (str): The task ID returned by create_task.
+
+    Returns:
+        Optional[Dict[str, Any]]: A copy of the task state, or None if unknown or expired.
+    """
+    task = _tasks.get(task_id)
+    return dict(task) if task is not None else None
+
+def update_task(task_id: str, **changes: Any) -> None:
+    """
+    Updates a task's state (e.g. status, project_id, error).
+
+    Args:
+        task_id (str): The task ID returned by create_task.
+        **changes: Fields to overwrite.
+    """
+    task = _tasks.get(task_id)
+    if task is not None:
+        _tasks.set(task_id, {**task, **changes}, TASK_TTL)
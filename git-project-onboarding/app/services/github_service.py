@@ -4,13 +4,145 @@ GitHub Service Module
 This module handles interactions with the GitHub API. It includes functionality for
 verifying access tokens, fetching user repositories, retrieving repository details,
 and downloading README content.
+
+All calls share one pooled HTTP/2 client so TCP/TLS connections are reused
+across requests; the application lifespan closes it on shutdown.
 """
 
+import asyncio
 import httpx
-import base64
-from typing import Dict, List, Any, Optional
+import hashlib
+import itertools
+import orjson
+from typing import Dict, List, Any, Optional, Tuple
 from fastapi import HTTPException, status
+from pydantic import TypeAdapter
 from app.core.config import GITHUB_API_URL
+from app.schemas.repository import GitHubRepoSummary
+from app.services.readme_cache import TTLCache
+
+# Built once at import; validates raw response bytes without a json.loads round trip
+_REPO_LIST_ADAPTER = TypeAdapter(List[GitHubRepoSummary])
+
+# Responses cached against their GitHub ETag, keyed by token hash + URL.
+# Conditional requests answered with 304 carry no body and don't count
+# against the rate limit, so unchanged data is served from here.
+# Bounded in size and age so a long-running worker doesn't keep every payload.
+ETAG_CACHE_TTL = 3600.0
+ETAG_CACHE_MAXSIZE = 2048
+_ETAG_CACHE = TTLCache(maxsize=ETAG_CACHE_MAXSIZE)
+
+_client: Optional[httpx.AsyncClient] = None
+_semaphore: Optional[asyncio.Semaphore] = None
+
+# At most this many GitHub requests are in flight at once, below GitHub's
+# secondary rate limit on concurrent requests.
+GITHUB_CONCURRENCY = 20
+# Longest Retry-After we are willing to wait before the single retry
+MAX_RETRY_AFTER = 60.0
+
+# Pagination for /user/repos: GitHub's maximum page size, and how many of the
+# remaining pages may be in flight at once (kept low for secondary rate limits).
+REPO_PAGE_SIZE = 100
+REPO_PAGE_CONCURRENCY = 10
+
+def get_client() -> httpx.AsyncClient:
+    """
+    Returns the shared GitHub API client, creating it on first use
+    (or again after it has been closed).
+
+    Returns:
+        httpx.AsyncClient: A pooled client with base_url set to GITHUB_API_URL.
+    """
+    global _client, _semaphore
+    if _client is None or _client.is_closed:
+        _semaphore = asyncio.Semaphore(GITHUB_CONCURRENCY)
+        _client = httpx.AsyncClient(
+            base_url=GITHUB_API_URL,
+            http2=True,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+            timeout=httpx.Timeout(30.0, connect=10.0),
+        )
+    return _client
+
+async def close_client() -> None:
+    """Closes the shared GitHub API client and its connection pool."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+def _retry_after(response: httpx.Response) -> Optional[float]:
+    """Seconds to wait before retrying a rate-limited (403/429) response, if GitHub says."""
+    if response.status_code not in (403, 429):
+        return None
+    try:
+        return min(float(response.headers["Retry-After"]), MAX_RETRY_AFTER)
+    except (KeyError, ValueError):
+        return None
+
+def _is_rate_limited(response: httpx.Response) -> bool:
+    """True for a 403 that is GitHub's primary or secondary rate limit, not a permissions error."""
+    return response.status_code == 403 and (
+        response.headers.get("X-RateLimit-Remaining") == "0" or "Retry-After" in response.headers
+    )
+
+async def _get(url: str, **kwargs: Any) -> httpx.Response:
+    """
+    Sends a GET through the shared client, gated by the GitHub concurrency limit.
+
+    A 403/429 carrying Retry-After is retried once after waiting (outside the
+    limit, so other requests keep flowing).
+
+    Returns:
+        httpx.Response: The response to the final attempt.
+    """
+    client = get_client()
+    async with _semaphore:
+        response = await client.get(url, **kwargs)
+
+    delay = _retry_after(response)
+    if delay is not None:
+        await asyncio.sleep(delay)
+        async with _semaphore:
+            response = await client.get(url, **kwargs)
+    return response
+
+def _auth_headers(access_token: str) -> Dict[str, str]:
+    """Builds the standard GitHub API request headers for a token."""
+    return {
+        "Authorization": f"Bearer {access_token}",
+        "Accept": "application/vnd.github.v3+json"
+    }
+
+def _conditional_request(access_token: str, url: str) -> Tuple[Dict[str, str], str, Optional[Tuple[str, Any]]]:
+    """
+    Prepares a conditional GET for a URL.
+
+    Returns:
+        Tuple: (headers including If-None-Match when a cached ETag exists,
+                cache key scoped to the token, cached (etag, value) or None).
+    """
+    headers = _auth_headers(access_token)
+    token_hash = hashlib.sha256(access_token.encode("utf-8")).hexdigest()
+    cache_key = f"{token_hash}:{url}"
+    cached = _ETAG_CACHE.get(cache_key)
+    if cached:
+        headers["If-None-Match"] = cached[0]
+    return headers, cache_key, cached
+
+def _last_page(response: httpx.Response) -> int:
+    """Reads the last page number from a paginated response's Link header (1 if absent)."""
+    last = response.links.get("last")
+    if not last:
+        return 1
+    return int(httpx.URL(last["url"]).params.get("page", 1))
+
+def _remember(cache_key: str, response: httpx.Response, value: Any) -> None:
+    """Caches the processed value of a 200 response under its ETag, if it has one."""
+    etag = response.headers.get("ETag")
+    if etag:
+        _ETAG_CACHE.set(cache_key, (etag, value), ETAG_CACHE_TTL)
 
 async def verify_access_token(access_token: str) -> Dict[str, Any]:
     """
@@ -23,28 +155,38 @@ async def verify_access_token(access_token: str) -> Dict[str, Any]:
         Dict[str, Any]: The user profile data if the token is valid.
 
     Raises:
-        HTTPException: If the token is invalid or the request fails (401 Unauthorized).
+        HTTPException: 401 Unauthorized if GitHub rejects the token (401/403);
+            429 if the token is rate-limited (including GitHub's rate-limit 403);
+            otherwise GitHub's own status (e.g. 5xx) so callers can retry.
     """
-    headers = {
-        "Authorization": f"Bearer {access_token}",
-        "Accept": "application/vnd.github.v3+json"
-    }
-    
-    async with httpx.AsyncClient() as client:
-        # Check against the GitHub user endpoint to specific validity
-        response = await client.get(f"{GITHUB_API_URL}/user", headers=headers)
-        
-        if response.status_code != 200:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid GitHub access token"
-            )
-            
-        return response.json()
+    # Check against the GitHub user endpoint to specific validity
+    response = await _get("/user", headers=_auth_headers(access_token))
+
+    # A rate-limited token is still valid; don't report it as rejected
+    if _is_rate_limited(response):
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="GitHub API rate limit exceeded"
+        )
+    if response.status_code in (401, 403):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid GitHub access token"
+        )
+    if response.status_code != 200:
+        raise HTTPException(
+            status_code=response.status_code,
+            detail=f"Failed to verify GitHub access token: {response.text}"
+        )
+
+    return orjson.loads(response.content)
 
 async def get_user_repositories(access_token: str) -> List[Dict[str, Any]]:
     """
-    Fetches the authenticated user's repositories from GitHub.
+    Fetches all of the authenticated user's repositories from GitHub.
+
+    The first page is requested alone; any further pages listed in its Link
+    header are then fetched concurrently (at most REPO_PAGE_CONCURRENCY at a time).
 
     Args:
         access_token (str): The GitHub access token.
@@ -56,42 +198,47 @@ async def get_user_repositories(access_token: str) -> List[Dict[str, Any]]:
     Raises:
         HTTPException: If the request to GitHub fails.
     """
-    headers = {
-        "Authorization": f"Bearer {access_token}",
-        "Accept": "application/vnd.github.v3+json"
-    }
-    
-    async with httpx.AsyncClient() as client:
-        # Fetching repositories with basic pagination support (page 1, 100 per page to get most)
-        # TODO: Implement full pagination to support users with > 100 repositories
-        response = await client.get(
-            f"{GITHUB_API_URL}/user/repos", 
-            headers=headers,
-            params={"per_page": 100, "sort": "updated"}
+    url = "/user/repos"
+    params = {"per_page": REPO_PAGE_SIZE, "sort": "updated"}
+    headers, cache_key, cached = _conditional_request(access_token, url)
+
+    # The first page tells us (via the Link header) how many pages there are
+    response = await _get(url, headers=headers, params={**params, "page": 1})
+
+    if response.status_code == 304 and cached:
+        return cached[1]
+
+    if response.status_code != 200:
+        raise HTTPException(
+            status_code=response.status_code,
+            detail="Failed to fetch repositories from GitHub"
         )
-        
-        if response.status_code != 200:
+
+    # Parse and trim to the fields we expose in one pass over the raw body
+    cleaned_repos = _REPO_LIST_ADAPTER.validate_json(response.content)
+
+    last_page = _last_page(response)
+    if last_page == 1:
+        # Only single-page results are cached: page 1's ETag says nothing about later pages
+        _remember(cache_key, response, cleaned_repos)
+        return cleaned_repos
+
+    semaphore = asyncio.Semaphore(REPO_PAGE_CONCURRENCY)
+    page_headers = _auth_headers(access_token)
+
+    async def fetch_page(page: int) -> List[Dict[str, Any]]:
+        async with semaphore:
+            page_response = await _get(url, headers=page_headers, params={**params, "page": page})
+        if page_response.status_code != 200:
             raise HTTPException(
-                status_code=response.status_code,
+                status_code=page_response.status_code,
                 detail="Failed to fetch repositories from GitHub"
             )
-            
-        repos_data = response.json()
-        
-        # Extract relevant fields to minimize data transfer and processing
-        cleaned_repos = []
-        for repo in repos_data:
-            cleaned_repos.append({
-                "id": repo.get("id"),
-                "name": repo.get("name"),
-                "full_name": repo.get("full_name"),
-                "html_url": repo.get("html_url"),
-                "private": repo.get("private"),
-                "default_branch": repo.get("default_branch"),
-                "owner_login": repo.get("owner", {}).get("login")
-            })
-            
-        return cleaned_repos
+        return _REPO_LIST_ADAPTER.validate_json(page_response.content)
+
+    remaining = await asyncio.gather(*(fetch_page(page) for page in range(2, last_page + 1)))
+    cleaned_repos.extend(itertools.chain.from_iterable(remaining))
+    return cleaned_repos
 
 async def get_repository_details(access_token: str, github_repo_id: int) -> Dict[str, Any]:
     """
@@ -108,36 +255,33 @@ async def get_repository_details(access_token: str, github_repo_id: int) -> Dict
     Raises:
         HTTPException: If the repository is not found (404) or other API errors occur.
     """
-    headers = {
-        "Authorization": f"Bearer {access_token}",
-        "Accept": "application/vnd.github.v3+json"
-    }
-    
-    async with httpx.AsyncClient() as client:
-        # NOTE: Using /repositories/{id} endpoint
-        response = await client.get(
-            f"{GITHUB_API_URL}/repositories/{github_repo_id}", 
-            headers=headers
+    # NOTE: Using /repositories/{id} endpoint
+    url = f"/repositories/{github_repo_id}"
+    headers, cache_key, cached = _conditional_request(access_token, url)
+    response = await _get(url, headers=headers)
+
+    if response.status_code == 304 and cached:
+        return dict(cached[1])
+
+    if response.status_code != 200:
+        status_code = response.status_code
+        detail = f"Failed to fetch repo {github_repo_id}: {response.text}"
+        raise HTTPException(
+            status_code=status_code,
+            detail=detail
         )
-        
-        if response.status_code != 200:
-            status_code = response.status_code
-            detail = f"Failed to fetch repo {github_repo_id}: {response.text}"
-            raise HTTPException(
-                status_code=status_code,
-                detail=detail
-            )
-            
-        repo_data = response.json()
-        
-        # Currently we explicitly map fields, but 'main.py' expects the raw dict
-        # or specific keys. Let's return the RAW dict plus our mapped keys for flexibility.
-        repo_data['github_repo_id'] = repo_data.get('id')
-        repo_data['repo_url'] = repo_data.get('html_url')
-        repo_data['is_private'] = repo_data.get('private')
-        repo_data['owner_name'] = repo_data.get('owner', {}).get('login')
-        
-        return repo_data
+
+    repo_data = orjson.loads(response.content)
+
+    # Currently we explicitly map fields, but 'main.py' expects the raw dict
+    # or specific keys. Let's return the RAW dict plus our mapped keys for flexibility.
+    repo_data['github_repo_id'] = repo_data.get('id')
+    repo_data['repo_url'] = repo_data.get('html_url')
+    repo_data['is_private'] = repo_data.get('private')
+    repo_data['owner_name'] = repo_data.get('owner', {}).get('login')
+
+    _remember(cache_key, response, repo_data)
+    return dict(repo_data)
 
 async def get_readme_content(access_token: str, full_name: str) -> str:
     """
@@ -153,38 +297,29 @@ async def get_readme_content(access_token: str, full_name: str) -> str:
     Raises:
         HTTPException: If the GitHub API returns an error other than 404.
     """
-    headers = {
-        "Authorization": f"Bearer {access_token}",
-        "Accept": "application/vnd.github.v3+json"
-    }
-    
-    async with httpx.AsyncClient() as client:
-        # GET /repos/{owner}/{repo}/readme
-        response = await client.get(
-            f"{GITHUB_API_URL}/repos/{full_name}/readme", 
-            headers=headers
+    # GET /repos/{owner}/{repo}/readme
+    # The raw media type returns the file bytes directly instead of a JSON
+    # envelope with base64 content, so there is nothing to unwrap or decode.
+    url = f"/repos/{full_name}/readme"
+    headers, cache_key, cached = _conditional_request(access_token, url)
+    headers["Accept"] = "application/vnd.github.raw+json"
+    response = await _get(url, headers=headers)
+
+    if response.status_code == 304 and cached:
+        return cached[1]
+
+    if response.status_code == 404:
+        return ""  # README not found, return empty string
+
+    if response.status_code != 200:
+        raise HTTPException(
+            status_code=response.status_code,
+            detail="Failed to fetch README from GitHub"
         )
-        
-        if response.status_code == 404:
-            return ""  # README not found, return empty string
-            
-        if response.status_code != 200:
-            raise HTTPException(
-                status_code=response.status_code,
-                detail="Failed to fetch README from GitHub"
-            )
-            
-        data = response.json()
-        content_b64 = data.get("content", "")
-        
-        if not content_b64:
-            return ""
-            
-        # Decode Base64 content to UTF-8 string
-        try:
-            return base64.b64decode(content_b64).decode("utf-8")
-        except Exception:
-            # Fallback for decoding errors (should be rare for valid GitHub responses)
-            return ""
 
+    # Undecodable bytes become U+FFFD rather than failing the whole README
+    readme_text = response.content.decode("utf-8", errors="replace")
+
+    _remember(cache_key, response, readme_text)
+    return readme_text
 
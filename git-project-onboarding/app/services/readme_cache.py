@@ -0,0 +1,119 @@
+"""
+README Cache Service
+
+This module keeps short-lived, in-process caches for the README pipeline so
+retries don't repeat expensive work:
+- a negative cache of repositories that have no README, and
+- a cache of LLM extraction results keyed by the SHA-256 of the README text.
+Failed extractions (all fields empty) are cached for a short time only.
+"""
+
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+NEGATIVE_TTL = 300.0
+EXTRACTION_TTL = 3600.0
+MAX_ENTRIES = 1024
+
+class TTLCache:
+    """
+    A small LRU cache whose entries expire after a per-entry time-to-live.
+    """
+
+    def __init__(self, maxsize: int = MAX_ENTRIES):
+        """
+        Args:
+            maxsize (int): Maximum number of entries before the oldest is evicted.
+        """
+        self.maxsize = maxsize
+        self._data: "OrderedDict[str, tuple]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Returns the cached value, or None if it is absent or expired."""
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at < time.monotonic():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        """Stores a value that expires after `ttl` seconds."""
+        self._data[key] = (value, time.monotonic() + ttl)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key: str) -> None:
+        """Removes an entry if present."""
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Removes every entry."""
+        self._data.clear()
+
+_missing_readmes = TTLCache()
+_extractions = TTLCache()
+
+def _readme_hash(readme_text: str) -> str:
+    return hashlib.sha256(readme_text.encode("utf-8")).hexdigest()
+
+def is_readme_missing(full_name: str) -> bool:
+    """
+    Checks whether a repository was recently found to have no README.
+
+    Args:
+        full_name (str): The full name of the repository (e.g., "owner/repo").
+
+    Returns:
+        bool: True if the repository is negatively cached.
+    """
+    return _missing_readmes.get(f"NEG:{full_name}") is not None
+
+def mark_readme_missing(full_name: str) -> None:
+    """
+    Records that a repository has no README for the next NEGATIVE_TTL seconds.
+
+    Args:
+        full_name (str): The full name of the repository (e.g., "owner/repo").
+    """
+    _missing_readmes.set(f"NEG:{full_name}", True, NEGATIVE_TTL)
+
+def get_extraction(readme_text: str) -> Optional[Dict[str, Any]]:
+    """
+    Looks up a previous extraction result for identical README content.
+
+    Args:
+        readme_text (str): The raw README text.
+
+    Returns:
+        Optional[Dict[str, Any]]: A copy of the cached result, or None on a miss.
+    """
+    if not readme_text:
+        return None
+    cached = _extractions.get(_readme_hash(readme_text))
+    if cached is None:
+        return None
+    return {**cached, "features": list(cached.get("features", []))}
+
+def store_extraction(readme_text: str, extracted_data: Dict[str, Any]) -> None:
+    """
+    Caches an extraction result for the given README content.
+
+    Successful results are kept for EXTRACTION_TTL seconds; empty results
+    (parse failures) only for NEGATIVE_TTL so the LLM is retried soon.
+
+    Args:
+        readme_text (str): The raw README text the result was extracted from.
+        extracted_data (Dict[str, Any]): The parser output.
+    """
+    if not readme_text:
+        return
+    failed = not any(extracted_data.get(k) for k in ("project_name", "description", "features"))
+    ttl = NEGATIVE_TTL if failed else EXTRACTION_TTL
+    _extractions.set(_readme_hash(readme_text), dict(extracted_data), ttl)
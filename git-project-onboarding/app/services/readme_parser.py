@@ -6,11 +6,41 @@ It extracts structured information such as project name, description, and featur
 from unstructured text content.
 """
 
-import json
+import asyncio
+import itertools
+import logging
 import re
 import httpx
+import orjson
 from typing import Dict, Any, List, Optional
-from app.core.config import OLLAMA_API_URL, OLLAMA_MODEL, OLLAMA_TIMEOUT
+from typing_extensions import Annotated, TypedDict
+from pydantic import Field, TypeAdapter, ValidationError
+from app.core.config import (
+    OLLAMA_API_URL,
+    OLLAMA_MODEL,
+    OLLAMA_TIMEOUT,
+    OLLAMA_KEEP_ALIVE,
+    OLLAMA_MAX_CONCURRENCY,
+    README_MAX_TOKENS,
+)
+from app.schemas.project import ReadmeExtract
+
+logger = logging.getLogger(__name__)
+
+class OllamaEnvelope(TypedDict):
+    """The single field read from an Ollama /api/generate response."""
+    response: Annotated[str, Field(default="")]
+
+# Built once at import; each parses and validates raw JSON in a single call
+_ENVELOPE_ADAPTER = TypeAdapter(OllamaEnvelope)
+_EXTRACT_ADAPTER = TypeAdapter(ReadmeExtract)
+
+# Fenced code blocks rarely describe features, so they are dropped from the prompt
+_CODE_FENCE_RE = re.compile(r"```.*?```", re.DOTALL)
+# Rough stand-in for the model's tokenizer: one token per word or punctuation mark
+_TOKEN_RE = re.compile(r"\w+|[^\w\s]")
+# Each fallback attempt rescans to the end of the text, so only this many '{' are tried
+MAX_JSON_ATTEMPTS = 32
 
 class ReadmeParser:
     """
@@ -25,6 +55,68 @@ class ReadmeParser:
         self.ollama_url = OLLAMA_API_URL
         self.model_name = OLLAMA_MODEL
         self.timeout = OLLAMA_TIMEOUT
+        self.keep_alive = OLLAMA_KEEP_ALIVE
+        self.max_concurrency = OLLAMA_MAX_CONCURRENCY
+        self.max_readme_tokens = README_MAX_TOKENS
+        self._client: Optional[httpx.AsyncClient] = None
+
+        # Construct Prompt for Llama 3.2 or compatible model
+        # The prompt strictly requests a JSON response to facilitate parsing.
+        self._prompt_head = """You are an advanced data extraction agent.
+I will provide you with the text of a software project README file.
+Your job is to extract the following information into a valid JSON object:
+1. "project_name": The name of the project.
+2. "description": A concise summary of what the project does (2-3 sentences).
+3. "features": A list of key features (array of strings).
+
+README CONTENT:
+"""
+        self._prompt_tail = """
+
+INSTRUCTIONS:
+- You must return ONLY the raw JSON object.
+- Do not add "Here is the JSON" or any markdown formatting like ```json ... ```.
+- If a field cannot be found, populate it with an empty string or empty list.
+"""
+        self._base_payload = {
+            "model": self.model_name,
+            "stream": False,
+            "format": "json",  # Ollama supports JSON mode which forces valid JSON output
+            "keep_alive": self.keep_alive  # Keep the model resident between calls
+        }
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Returns the shared Ollama client, creating it on first use."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(timeout=self.timeout)
+        return self._client
+
+    async def aclose(self):
+        """Closes the shared Ollama client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def parse_readmes(self, readme_texts: List[str]) -> List[Dict[str, Any]]:
+        """
+        Parses several README files concurrently.
+
+        At most `max_concurrency` requests are in flight at once, so model
+        inference for one README overlaps with network I/O for the others.
+
+        Args:
+            readme_texts (List[str]): The raw README contents.
+
+        Returns:
+            List[Dict[str, Any]]: One result per input, in the same order.
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def _parse_one(text: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.parse_readme(text)
+
+        return await asyncio.gather(*(_parse_one(text) for text in readme_texts))
 
     async def parse_readme(self, readme_text: str) -> Dict[str, Any]:
         """
@@ -48,52 +140,35 @@ class ReadmeParser:
         if not readme_text:
             return default_result
 
-        # Construct Prompt for Llama 3.2 or compatible model
-        # The prompt strictly requests a JSON response to facilitate parsing.
-        prompt = f"""You are an advanced data extraction agent.
-I will provide you with the text of a software project README file.
-Your job is to extract the following information into a valid JSON object:
-1. "project_name": The name of the project.
-2. "description": A concise summary of what the project does (2-3 sentences).
-3. "features": A list of key features (array of strings).
-
-README CONTENT:
-{readme_text[:4000]}
-
-INSTRUCTIONS:
-- You must return ONLY the raw JSON object.
-- Do not add "Here is the JSON" or any markdown formatting like ```json ... ```.
-- If a field cannot be found, populate it with an empty string or empty list.
-"""
-
-        payload = {
-            "model": self.model_name,
-            "prompt": prompt,
-            "stream": False,
-            "format": "json"  # Ollama supports JSON mode which forces valid JSON output
-        }
+        # Only the README excerpt varies; the surrounding prompt and payload are built once in __init__
+        prompt = f"{self._prompt_head}{self._prepare_readme(readme_text, self.max_readme_tokens)}{self._prompt_tail}"
+        payload = {**self._base_payload, "prompt": prompt}
 
         try:
-            async with httpx.AsyncClient() as client:
-                # Increased timeout to handle potentially slow local inference on consumer hardware
-                response = await client.post(self.ollama_url, json=payload, timeout=self.timeout)
-                
-                if response.status_code != 200:
-                    # Log error details for debugging (in a real app, use a logger)
-                    print(f"Ollama Error: {response.status_code} - {response.text}")
-                    return default_result
-                
-                result_data = response.json()
-                generated_text = result_data.get("response", "")
-                
-                # Debug print to verify model output during development
-                print(f"DEBUG: Ollama Raw Output: {generated_text[:100]}...")
-
-                return self._extract_json(generated_text)
+            # Increased timeout to handle potentially slow local inference on consumer hardware
+            response = await self._get_client().post(
+                self.ollama_url,
+                content=orjson.dumps(payload),
+                headers={"Content-Type": "application/json"},
+                timeout=self.timeout
+            )
+            
+            if response.status_code != 200:
+                logger.error("Ollama Error: %s - %s", response.status_code, response.text)
+                return default_result
+            
+            # Only the "response" field is materialised from the envelope
+            generated_text = _ENVELOPE_ADAPTER.validate_json(response.content)["response"]
+            
+            # Raw model output, useful when tuning the prompt; skipped entirely unless DEBUG is on
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Ollama Raw Output: %s...", generated_text[:100])
+
+            return self._extract_json(generated_text)
 
         except Exception as e:
             # Catch-all for network errors or model failures to prevent app crash
-            print(f"Error during Ollama parsing: {type(e).__name__} - {str(e)}")
+            logger.error("Error during Ollama parsing: %s - %s", type(e).__name__, e)
             return default_result
 
     def _extract_json(self, text: str) -> Dict[str, Any]:
@@ -106,14 +181,21 @@ INSTRUCTIONS:
         Returns:
             Dict[str, Any]: The validated data dictionary.
         """
+        # Fast path: the whole response is a well-formed object, parsed and validated in one pass
+        try:
+            return _EXTRACT_ADAPTER.validate_json(text)
+        except ValidationError:
+            pass
+
         try:
-            # Find JSON/Dict pattern in case the model returns extra text despite instructions
-            match = re.search(r"\{.*\}", text, re.DOTALL)
-            if match:
-                json_str = match.group(0)
-                data = json.loads(json_str)
-                
-                # Validation and type cleaning to ensure response matches schema
+            data = self._load_json(text)
+            if data is not None:
+                try:
+                    return _EXTRACT_ADAPTER.validate_python(data)
+                except ValidationError:
+                    pass
+
+                # Validation and type cleaning for output that doesn't match the schema
                 return {
                     "project_name": str(data.get("project_name", "")),
                     "description": str(data.get("description", "")),
@@ -129,5 +211,103 @@ INSTRUCTIONS:
             "features": []
         }
 
+    @staticmethod
+    def _prepare_readme(readme_text: str, max_tokens: int) -> str:
+        """
+        Shrinks the README to the part worth sending to the model.
+
+        Fenced code blocks are removed (unless that leaves nothing), then the
+        text is cut after roughly `max_tokens` tokens.
+
+        Args:
+            readme_text (str): The raw README content.
+            max_tokens (int): Approximate token budget for the excerpt (at least 1).
+
+        Returns:
+            str: The trimmed README text.
+        """
+        text = _CODE_FENCE_RE.sub("", readme_text)
+        if not text.strip():
+            text = readme_text
+
+        # islice rejects a negative start, so a non-positive budget keeps a single token
+        max_tokens = max(1, max_tokens)
+        last = None
+        for last in itertools.islice(_TOKEN_RE.finditer(text), max_tokens - 1, max_tokens):
+            pass
+        return text[:last.end()] if last else text
+
+    @staticmethod
+    def _load_json(text: str) -> Optional[Any]:
+        """
+        Decodes the JSON object in the model's response.
+
+        Ollama is called in JSON mode, so the response is normally the object
+        itself and a plain orjson.loads succeeds. Otherwise each '{' in turn (up to
+        MAX_JSON_ATTEMPTS of them) is tried as the start of an object wrapped in
+        extra text.
+
+        Args:
+            text (str): The raw string output from the LLM.
+
+        Returns:
+            Optional[Any]: The decoded value, or None if no JSON object was found.
+        """
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass
+
+        # Find JSON/Dict span in case the model returns extra text despite instructions
+        start = text.find("{")
+        attempts = 0
+        while start != -1 and attempts < MAX_JSON_ATTEMPTS:
+            attempts += 1
+            end = _find_json_span(text, start)
+            if end is not None:
+                try:
+                    return orjson.loads(text[start:end])
+                except orjson.JSONDecodeError:
+                    pass
+            # An unbalanced or invalid span may still contain a valid object further on
+            start = text.find("{", start + 1)
+        return None
+
+def _find_json_span(text: str, start: int) -> Optional[int]:
+    """
+    Finds the end of the brace-balanced span opening at text[start].
+
+    A single forward scan tracking brace depth; braces inside JSON strings
+    (including escaped quotes) are ignored.
+
+    Args:
+        text (str): The text to scan.
+        start (int): Index of the opening '{'.
+
+    Returns:
+        Optional[int]: The index just past the matching '}', or None if unbalanced.
+    """
+    depth = 0
+    in_string = False
+    escaped = False
+    for i in range(start, len(text)):
+        ch = text[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif ch == "\\":
+                escaped = True
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            in_string = True
+        elif ch == "{":
+            depth += 1
+        elif ch == "}":
+            depth -= 1
+            if depth == 0:
+                return i + 1
+    return None
+
 # Singleton instance for import usage
 parser = ReadmeParser()
@@ -5,10 +5,25 @@ This script helps verify the content of the local database by printing the most
 recently created project. Useful for debugging without a GUI.
 """
 
+from sqlalchemy import select
 from app.db.database import SessionLocal
 from app.models.project import Project
 import json
 
+# Only the printed columns, so rows come back as plain tuples without ORM instances
+LATEST_PROJECT = (
+    select(
+        Project.id,
+        Project.project_name,
+        Project.description,
+        Project.features,
+        Project.repository_id,
+        Project.created_at,
+    )
+    .order_by(Project.id.desc())
+    .limit(1)
+)
+
 def check_latest_project():
     """
     Queries and prints details of the most recently created project.
@@ -16,7 +31,7 @@ def check_latest_project():
     db = SessionLocal()
     try:
         # Get the most recent project
-        project = db.query(Project).order_by(Project.id.desc()).first()
+        project = db.execute(LATEST_PROJECT).first()
         
         if project:
             print(f"--- Latest Project (ID: {project.id}) ---")
@@ -1,5 +1,7 @@
 import httpx
+import streamlit as st
 from typing import Optional, Dict, List, Any
+import functools
 import os
 import logging
 
@@ -9,6 +11,19 @@ logger = logging.getLogger(__name__)
 # Base URL configuration
 API_BASE_URL = os.getenv("API_BASE_URL", "http://127.0.0.1:8000")
 
+@functools.lru_cache(maxsize=1)
+def get_client() -> httpx.Client:
+    """
+    Returns the shared backend client, created on first use.
+
+    Every call reuses the same keep-alive connection to the backend for the
+    lifetime of the Streamlit process.
+
+    Returns:
+        httpx.Client: A client with base_url set to API_BASE_URL.
+    """
+    return httpx.Client(base_url=API_BASE_URL, timeout=httpx.Timeout(30.0, connect=10.0))
+
 def authenticate(token: str) -> Optional[Dict[str, Any]]:
     """
     Authenticates the user with the backend using their GitHub token.
@@ -21,7 +36,7 @@ def authenticate(token: str) -> Optional[Dict[str, Any]]:
     """
     try:
         headers = {"Authorization": f"Bearer {token}"}
-        response = httpx.post(f"{API_BASE_URL}/auth/verify-token", headers=headers, json={})
+        response = get_client().post("/auth/verify-token", headers=headers, json={})
         
         if response.status_code == 200:
             return response.json()
@@ -32,6 +47,31 @@ def authenticate(token: str) -> Optional[Dict[str, Any]]:
         logger.error(f"Connection error during authentication: {str(e)}")
         return None
 
+# How long a fetched repository list is reused before the backend is asked again
+REPOS_CACHE_TTL = 60
+
+@st.cache_data(ttl=REPOS_CACHE_TTL, show_spinner=False)
+def fetch_repositories(token: str) -> List[Dict[str, Any]]:
+    """
+    Fetches the list of repositories for the authenticated user, cached per token.
+
+    Only successful responses are cached; errors are raised so the next call
+    retries the backend.
+    
+    Args:
+        token (str): The GitHub Personal Access Token.
+        
+    Returns:
+        List[Dict[str, Any]]: A list of repository dictionaries.
+
+    Raises:
+        httpx.HTTPStatusError: If the backend returns a non-2xx response.
+    """
+    headers = {"Authorization": f"Bearer {token}"}
+    response = get_client().get("/repos/", headers=headers)
+    response.raise_for_status()
+    return response.json()
+
 def get_repositories(token: str) -> List[Dict[str, Any]]:
     """
     Fetches the list of repositories for the authenticated user.
@@ -43,18 +83,52 @@ def get_repositories(token: str) -> List[Dict[str, Any]]:
         List[Dict[str, Any]]: A list of repository dictionaries.
     """
     try:
-        headers = {"Authorization": f"Bearer {token}"}
-        response = httpx.get(f"{API_BASE_URL}/repos/", headers=headers)
-        
-        if response.status_code == 200:
-            return response.json()
-        else:
-            logger.error(f"Failed to fetch repositories: {response.text}")
-            return []
+        return fetch_repositories(token)
+    except httpx.HTTPStatusError as e:
+        logger.error(f"Failed to fetch repositories: {e.response.text}")
+        return []
     except Exception as e:
         logger.error(f"Error fetching repositories: {str(e)}")
         return []
 
+def submit_generation(token: str, repo_id: int) -> Dict[str, Any]:
+    """
+    Queues project generation for a repository on the backend.
+
+    Args:
+        token (str): The GitHub Personal Access Token.
+        repo_id (int): The local repository ID (not GitHub ID).
+
+    Returns:
+        Dict[str, Any]: The queued task, including its task_id.
+
+    Raises:
+        httpx.HTTPStatusError: If the backend rejects the request.
+    """
+    headers = {"Authorization": f"Bearer {token}"}
+    response = get_client().post(f"/projects/generate/{repo_id}/task", headers=headers)
+    response.raise_for_status()
+    return response.json()
+
+def get_generation_status(token: str, task_id: str) -> Dict[str, Any]:
+    """
+    Gets the state of a queued project generation.
+
+    Args:
+        token (str): The GitHub Personal Access Token.
+        task_id (str): The ID returned by submit_generation.
+
+    Returns:
+        Dict[str, Any]: The task status, with "project" set once completed.
+
+    Raises:
+        httpx.HTTPStatusError: If the backend returns a non-2xx response.
+    """
+    headers = {"Authorization": f"Bearer {token}"}
+    response = get_client().get(f"/projects/generate/{task_id}/status", headers=headers)
+    response.raise_for_status()
+    return response.json()
+
 def get_project_details(token: str, repo_id: int, generate_if_missing: bool = False) -> Optional[Dict[str, Any]]:
     """
     Gets details of a project associated with a repository.
@@ -74,8 +148,8 @@ def get_project_details(token: str, repo_id: int, generate_if_missing: bool = Fa
             # Call generation endpoint (POST) - This creates OR returns existing if logic permits
             # Ideally the backend logic handles "if exists return, else create"
             timeout = httpx.Timeout(300.0, connect=60.0)
-            response = httpx.post(
-                f"{API_BASE_URL}/projects/generate/{repo_id}", 
+            response = get_client().post(
+                f"/projects/generate/{repo_id}", 
                 headers=headers,
                 timeout=timeout
             )
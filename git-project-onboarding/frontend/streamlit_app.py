@@ -10,13 +10,18 @@ import streamlit as st
 import httpx
 import json
 import os
+import time
 from dotenv import load_dotenv
+from api_client import fetch_repositories, get_generation_status, submit_generation
 
 # Load environment variables
 load_dotenv()
 
 # Configuration
 API_BASE_URL = os.getenv("API_BASE_URL", "http://127.0.0.1:8000")
+# Polling for background generation: interval between status checks and overall limit
+GENERATION_POLL_INTERVAL = 2.0
+GENERATION_TIMEOUT = 600.0
 
 st.set_page_config(
     page_title="Multimodal RAG Generator", 
@@ -93,12 +98,11 @@ if st.session_state.access_token:
             if st.button("🔄 Fetch Repositories"):
                 try:
                     with st.spinner("Fetching from GitHub..."):
-                        response = httpx.get(f"{API_BASE_URL}/repos/", headers=headers)
-                        if response.status_code == 200:
-                            st.session_state.repos_list = response.json()
-                            st.toast(f"Fetched {len(st.session_state.repos_list)} repositories")
-                        else:
-                            st.error(f"Failed to fetch: {response.text}")
+                        # Cached per token for a short TTL, so repeated clicks skip the backend
+                        st.session_state.repos_list = fetch_repositories(st.session_state.access_token)
+                        st.toast(f"Fetched {len(st.session_state.repos_list)} repositories")
+                except httpx.HTTPStatusError as e:
+                    st.error(f"Failed to fetch: {e.response.text}")
                 except Exception as e:
                     st.error(f"Connection Error: {e}")
 
@@ -139,42 +143,50 @@ if st.session_state.access_token:
         
         if st.button("🚀 Run Analysis"):
             try:
-                # Custom timeout for long LLM inference
-                timeout = httpx.Timeout(300.0, connect=60.0) 
-                
+                # Queue the job, then poll its status so the request isn't held open during inference
+                task = submit_generation(st.session_state.access_token, repo_id_input)
+                status_box = st.empty()
+                started = time.monotonic()
+
                 with st.spinner("🧠 Reading README and analyzing with Llama 3.2... (This can take up to 5 mins)"):
-                    gen_res = httpx.post(
-                        f"{API_BASE_URL}/projects/generate/{repo_id_input}", 
-                        headers=headers, 
-                        timeout=timeout
-                    )
+                    while task["status"] in ("pending", "running"):
+                        elapsed = time.monotonic() - started
+                        if elapsed > GENERATION_TIMEOUT:
+                            break
+                        status_box.caption(f"Status: {task['status']} ({elapsed:.0f}s elapsed)")
+                        time.sleep(GENERATION_POLL_INTERVAL)
+                        task = get_generation_status(st.session_state.access_token, task["task_id"])
+                status_box.empty()
+
+                if task["status"] == "completed":
+                    project = task["project"]
+                    st.balloons()
                     
-                    if gen_res.status_code == 200:
-                        project = gen_res.json()
-                        st.balloons()
-                        
-                        # --- Result Display ---
-                        st.subheader(f"🏷️ {project.get('project_name', 'Untitled')}")
-                        st.markdown(f"_{project.get('description', 'No description extracted')}_")
-                        
-                        st.markdown("### ✨ Extracted Features")
-                        features = project.get('features', [])
-                        if features:
-                            for f in features:
-                                st.success(f"🔹 {f}")
-                        else:
-                            st.warning("No specific features detected.")
-                            
-                        with st.expander("🔍 View Raw JSON Response"):
-                            st.json(project)
-                            
-                    elif gen_res.status_code == 404:
-                         st.error("Repository not found in DB. Did you connect it in Tab 1?")
+                    # --- Result Display ---
+                    st.subheader(f"🏷️ {project.get('project_name', 'Untitled')}")
+                    st.markdown(f"_{project.get('description', 'No description extracted')}_")
+                    
+                    st.markdown("### ✨ Extracted Features")
+                    features = project.get('features', [])
+                    if features:
+                        for f in features:
+                            st.success(f"🔹 {f}")
                     else:
-                        st.error(f"Generation Failed ({gen_res.status_code}): {gen_res.text}")
+                        st.warning("No specific features detected.")
                         
-            except httpx.ReadTimeout:
-                st.error("⏰ The model took too long to respond. The server might still be processing it.")
+                    with st.expander("🔍 View Raw JSON Response"):
+                        st.json(project)
+
+                elif task["status"] == "failed":
+                    st.error(f"Generation Failed: {task.get('error')}")
+                else:
+                    st.error("⏰ The model took too long to respond. The server might still be processing it.")
+
+            except httpx.HTTPStatusError as e:
+                if e.response.status_code == 404:
+                    st.error("Repository not found in DB. Did you connect it in Tab 1?")
+                else:
+                    st.error(f"Generation Failed ({e.response.status_code}): {e.response.text}")
             except Exception as e:
                 st.error(f"Error: {e}")
 
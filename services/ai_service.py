@@ -1,5 +1,9 @@
 import logging
 import asyncio
+import hashlib
+import json
+import os
+import sqlite3
 from services.path_manager import setup_paths
 
 # Setup paths
@@ -13,19 +17,73 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# On-disk cache of parsed READMEs, anchored to the project root rather than the CWD
+README_CACHE_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".cache", "readme.sqlite"
+)
+
+# Bump when the parsing prompt or output shape changes so stale cache entries are ignored
+README_PROMPT_VERSION = 1
+
 class AIService:
     """
     Service layer for AI-based operations.
     Wraps README parsing and potentially other LLM tasks.
     """
-    
+
+    def __init__(self, cache_path: str = README_CACHE_PATH):
+        """
+        Opens the README result cache, so unchanged READMEs skip the LLM on later runs.
+
+        Args:
+            cache_path (str): Location of the SQLite cache file.
+        """
+        self._cache = None
+        try:
+            os.makedirs(os.path.dirname(cache_path) or ".", exist_ok=True)
+            self._cache = sqlite3.connect(cache_path, check_same_thread=False)
+            self._cache.execute("PRAGMA journal_mode=WAL")
+            self._cache.execute(
+                "CREATE TABLE IF NOT EXISTS readme_cache (sha256 TEXT PRIMARY KEY, payload BLOB)"
+            )
+            self._cache.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"README cache unavailable: {e}")
+            self._cache = None
+
+    def _cache_get(self, key: str):
+        """Returns the cached parse result for a cache key, or None."""
+        if self._cache is None:
+            return None
+        try:
+            row = self._cache.execute(
+                "SELECT payload FROM readme_cache WHERE sha256 = ?", (key,)
+            ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"README cache read failed: {e}")
+            return None
+        return json.loads(row[0]) if row else None
+
+    def _cache_set(self, key: str, data: dict):
+        """Stores a parse result under a cache key."""
+        if self._cache is None:
+            return
+        try:
+            self._cache.execute(
+                "INSERT OR REPLACE INTO readme_cache (sha256, payload) VALUES (?, ?)",
+                (key, json.dumps(data)),
+            )
+            self._cache.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"README cache write failed: {e}")
+
     async def parse_readme(self, content: str) -> dict:
         """
         Parses README content using the Llama model via Ollama.
-        
+
         Args:
             content (str): The markdown content of the README.
-            
+
         Returns:
             dict: Extracted project details (name, description, features).
         """
@@ -33,14 +91,28 @@ class AIService:
             logger.error("Parser unavailable.")
             return {}
 
+        # The key covers the model and prompt version too, so switching either re-runs the LLM
+        model_name = getattr(parser, "model_name", "")
+        key = hashlib.sha256(
+            f"{model_name}\0{README_PROMPT_VERSION}\0{content or ''}".encode("utf-8")
+        ).hexdigest()
+        cached = self._cache_get(key)
+        if cached is not None:
+            logger.info("Using cached README analysis.")
+            return cached
+
         try:
             # Add a timeout to avoid blocking the whole pipeline if LLM is slow/down
             # We use asyncio.wait_for inside here
             extracted_data = await asyncio.wait_for(parser.parse_readme(content), timeout=60.0)
-            return extracted_data
         except asyncio.TimeoutError:
             logger.warning("README parsing timed out (Ollama slow/unreachable). Returning empty metadata.")
             return {}
         except Exception as e:
             logger.error(f"Failed to parse README: {e}")
             return {}
+
+        # Empty results mean the model failed; leave them uncached so the next run retries
+        if any(extracted_data.get(k) for k in ("project_name", "description", "features")):
+            self._cache_set(key, extracted_data)
+        return extracted_data
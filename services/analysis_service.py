@@ -1,8 +1,13 @@
 import logging
 import asyncio
+import heapq
+import mmap
+import multiprocessing
 import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from services.path_manager import setup_paths
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 
 # Ensure paths
 setup_paths()
@@ -22,10 +27,99 @@ try:
     NEXATEST_AVAILABLE = True
 except ImportError:
     NEXATEST_AVAILABLE = False
-    def nexatest_analyze(path): return {}
+    def nexatest_analyze(path, code=None): return {}
 
 logger = logging.getLogger(__name__)
 
+# Below this many files the process pool's startup cost outweighs the parallelism
+PARALLEL_MIN_FILES = 8
+# Files handed to a worker per round trip
+POOL_CHUNKSIZE = 8
+# analyze_files runs in a thread (asyncio.to_thread), and forking a multithreaded
+# process can deadlock on locks other threads hold, so workers never start via fork()
+POOL_START_METHOD = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+
+# Only the files with the most findings are offered to the AI reviewer
+AI_REVIEW_TOP_K = 10
+
+# Files at least this large are decoded straight from a memory map
+MMAP_MIN_SIZE = 64 * 1024
+
+# Per-process SecurityAnalyzer, built once by the pool initializer
+_worker_security_analyzer = None
+
+def _init_worker():
+    """Process pool initializer: builds this worker's SecurityAnalyzer once."""
+    global _worker_security_analyzer
+    _worker_security_analyzer = SecurityAnalyzer() if SecurityAnalyzer else None
+
+def _analyze_file_worker(file_path: str) -> Optional[Dict[str, Any]]:
+    """Process pool entry point: analyzes one file with the worker's analyzer."""
+    return _analyze_file_safe(file_path, _worker_security_analyzer)
+
+def _analyze_file_safe(file_path: str, security_analyzer) -> Optional[Dict[str, Any]]:
+    """Analyzes one file, logging and returning None on failure."""
+    try:
+        return _analyze_single_file(file_path, security_analyzer)
+    except Exception as e:
+        logger.error(f"Analysis failed for {file_path}: {e}")
+        return None
+
+def _read_source(file_path: str) -> str:
+    """
+    Reads a source file as text, ignoring undecodable bytes.
+
+    Large files are decoded directly from an mmap of the file, skipping the
+    intermediate bytes copy a buffered read would make.
+    """
+    with open(file_path, "rb") as f:
+        if os.fstat(f.fileno()).st_size < MMAP_MIN_SIZE:
+            return f.read().decode("utf-8", errors="ignore")
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return str(mm, "utf-8", "ignore")
+
+def _analyze_single_file(file_path: str, security_analyzer) -> Dict[str, Any]:
+    """Runs NexaTest and the security scan on one file and summarises the findings."""
+    report = {}
+    findings = []
+
+    # Read once; both analyzers work on the same text
+    content = _read_source(file_path)
+
+    # 1. Run NexaTest Analysis
+    if NEXATEST_AVAILABLE:
+        report = nexatest_analyze(file_path, code=content)
+        findings = report.get("issues", [])
+    else:
+        report = {"file": file_path, "summary": {}, "issues": []}
+
+    # 2. Run Security Analysis
+    if security_analyzer:
+        try:
+            security_issues = security_analyzer.analyze(file_path, content)
+            if security_issues:
+                findings.extend(security_issues)
+        except Exception as e:
+            logger.error(f"Security scan failed for {file_path}: {e}")
+
+    # 3. Update Summary (one pass over the findings for all three counts)
+    errors = warnings = security = 0
+    for issue in findings:
+        severity = issue.get("severity")
+        errors += severity == "error"
+        warnings += severity == "warning"
+        security += issue.get("type") == "security"
+
+    report["issues"] = findings
+    report["summary"] = {
+        "total": len(findings),
+        "errors": errors,
+        "warnings": warnings,
+        "security": security
+    }
+    
+    return report
+
 class AnalysisService:
     """
     Orchestrates code analysis using NexaTest and SecurityAnalyzer.
@@ -45,63 +139,47 @@ class AnalysisService:
         Returns:
             List[Dict]: Analysis results per file.
         """
-        results = []
         logger.info(f"Analyzing {len(file_paths)} files...")
 
-        for file_path in file_paths:
+        # Files are independent and CPU-bound, so larger batches are spread across processes
+        reports = None
+        if len(file_paths) >= PARALLEL_MIN_FILES:
             try:
-                file_report = self._analyze_single_file(file_path)
-                results.append(file_report)
-            except Exception as e:
-                logger.error(f"Analysis failed for {file_path}: {e}")
+                with ProcessPoolExecutor(
+                    max_workers=os.cpu_count(),
+                    mp_context=multiprocessing.get_context(POOL_START_METHOD),
+                    initializer=_init_worker,
+                ) as executor:
+                    reports = list(executor.map(_analyze_file_worker, file_paths, chunksize=POOL_CHUNKSIZE))
+            except (BrokenProcessPool, OSError) as e:
+                logger.warning(f"Process pool unavailable ({e}); analyzing files serially.")
+
+        if reports is None:
+            reports = [_analyze_file_safe(path, self.security_analyzer) for path in file_paths]
+
+        # Keyed by path so AI suggestions can be merged back with a dict lookup
+        results_by_file: Dict[str, Dict[str, Any]] = {
+            path: report for path, report in zip(file_paths, reports) if report is not None
+        }
         
         # Run AI Review for top problem files if available
         if self.ai_reviewer:
             try:
+                # The reviewer only looks at the worst files, so don't hand it the whole list
+                top_results = heapq.nlargest(
+                    AI_REVIEW_TOP_K, results_by_file.values(), key=lambda r: r.get('summary', {}).get('total', 0)
+                )
+
                 # Pass empty string for readme_content as requested
-                ai_reviews = self.ai_reviewer.generate_ai_review(results, "")
+                ai_reviews = self.ai_reviewer.generate_ai_review(top_results, "")
                 
                 # Merge AI suggestions into results
-                review_map = {item['file']: item['ai_suggestions'] for item in ai_reviews}
-                for res in results:
-                    if res.get('file') in review_map:
-                        res['ai_suggestions'] = review_map[res['file']]
+                for item in ai_reviews:
+                    res = results_by_file.get(item['file'])
+                    if res is not None:
+                        res['ai_suggestions'] = item['ai_suggestions']
                         
             except Exception as e:
                 logger.error(f"AI Review failed: {e}")
                 
-        return results
-
-    def _analyze_single_file(self, file_path: str) -> Dict[str, Any]:
-        """Internal helper to analyze one file."""
-        report = {}
-        findings = []
-
-        # 1. Run NexaTest Analysis
-        if NEXATEST_AVAILABLE:
-            report = nexatest_analyze(file_path)
-            findings = report.get("issues", [])
-        else:
-            report = {"file": file_path, "summary": {}, "issues": []}
-
-        # 2. Run Security Analysis
-        if self.security_analyzer:
-            try:
-                with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
-                    content = f.read()
-                security_issues = self.security_analyzer.analyze(file_path, content)
-                if security_issues:
-                    findings.extend(security_issues)
-            except Exception as e:
-                logger.error(f"Security scan failed for {file_path}: {e}")
-
-        # 3. Update Summary
-        report["issues"] = findings
-        report["summary"] = {
-            "total": len(findings),
-            "errors": sum(1 for issue in findings if issue.get("severity") == "error"),
-            "warnings": sum(1 for issue in findings if issue.get("severity") == "warning"),
-            "security": sum(1 for issue in findings if issue.get("type") == "security")
-        }
-        
-        return report
+        return list(results_by_file.values())
@@ -1,5 +1,7 @@
 import os
+import json
 import logging
+from typing import Dict
 from services.path_manager import setup_paths
 
 # Setup paths before imports
@@ -13,26 +15,60 @@ except ImportError as e:
 
 logger = logging.getLogger(__name__)
 
+# Remembers url -> local clone path across pipeline runs, anchored to the project root rather than the CWD
+CLONE_INDEX_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".cache", "clone_index.json"
+)
+
 class CloneService:
     """
     Manages repository cloning operations.
     Handles errors if cloning module is missing.
     """
-    def __init__(self, clone_root="cloned_repos"):
+    def __init__(self, clone_root="cloned_repos", index_path: str = CLONE_INDEX_PATH):
         self.clone_root = os.path.join(os.getcwd(), clone_root)
         self.manager = RepoManager(self.clone_root) if RepoManager else None
+        self.index_path = index_path
+        self._seen: Dict[str, str] = self._load_index()
+
+    def _load_index(self) -> Dict[str, str]:
+        """Reads the persisted url -> path index, if any."""
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_index(self):
+        """Writes the url -> path index atomically."""
+        try:
+            os.makedirs(os.path.dirname(self.index_path) or ".", exist_ok=True)
+            tmp_path = f"{self.index_path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self._seen, f)
+            os.replace(tmp_path, self.index_path)
+        except OSError as e:
+            logger.warning(f"Could not save clone index: {e}")
 
     def ensure_cloned(self, repo_url: str, token: str) -> str:
         """
         Clones or updates a repository locally.
-        
+
+        A repository already cloned by this or an earlier run is returned
+        without going through RepoManager again.
+
         Args:
             repo_url (str): The clone URL for the repository.
             token (str): Authentication token.
-            
+
         Returns:
             str: Path to the cloned repository.
         """
+        cached_path = self._seen.get(repo_url)
+        if cached_path and os.path.isdir(os.path.join(cached_path, ".git")):
+            logger.info(f"Using existing clone at: {cached_path}")
+            return cached_path
+
         if not self.manager:
             logger.error("RepoManager unavailable. Cannot clone.")
             return None
@@ -41,7 +77,10 @@ class CloneService:
             logger.info(f"Cloning repository: {repo_url}")
             repo_path = self.manager.clone_repository(repo_url, token)
             logger.info(f"Repository cloned at: {repo_path}")
-            return repo_path
         except Exception as e:
             logger.error(f"Clone failed: {e}")
             raise
+
+        self._seen[repo_url] = repo_path
+        self._save_index()
+        return repo_path
@@ -1,5 +1,7 @@
 import logging
 import asyncio
+import hashlib
+import httpx
 from services.path_manager import setup_paths
 
 # Ensure paths are set up before importing app modules
@@ -10,7 +12,9 @@ try:
         verify_access_token, 
         get_user_repositories, 
         get_repository_details, 
-        get_readme_content
+        get_readme_content,
+        get_client,
+        close_client
     )
 except ImportError:
     # Handle cases where import might fail if paths are not correct
@@ -20,27 +24,88 @@ except ImportError:
     async def get_user_repositories(*args, **kwargs): return []
     async def get_repository_details(*args, **kwargs): return {}
     async def get_readme_content(*args, **kwargs): return ""
+    def get_client(*args, **kwargs): return None
+    async def close_client(*args, **kwargs): return None
 
 logger = logging.getLogger(__name__)
 
+# Retry policy for transient GitHub failures (timeouts, dropped connections, 429/5xx)
+MAX_ATTEMPTS = 4
+BACKOFF_BASE = 1.0
+BACKOFF_MAX = 16.0
+RETRYABLE_STATUS = frozenset({429, 500, 502, 503, 504})
+
+def _is_transient(exc: Exception) -> bool:
+    """Whether a failed GitHub call is worth retrying."""
+    if isinstance(exc, httpx.TransportError):
+        return True
+    # The wrapped functions surface HTTP errors as HTTPException(status_code=...)
+    return getattr(exc, "status_code", None) in RETRYABLE_STATUS
+
+async def _with_retry(func, *args):
+    """
+    Awaits func(*args), retrying transient failures with exponential backoff.
+
+    Rate-limit responses that carry Retry-After are already waited out once by
+    the underlying client; this covers whatever still fails after that.
+
+    Args:
+        func: The async GitHub function to call.
+        *args: Arguments passed through to func.
+
+    Returns:
+        The result of the first successful call.
+    """
+    for attempt in range(1, MAX_ATTEMPTS + 1):
+        try:
+            return await func(*args)
+        except Exception as e:
+            if attempt == MAX_ATTEMPTS or not _is_transient(e):
+                raise
+            delay = min(BACKOFF_BASE * 2 ** (attempt - 1), BACKOFF_MAX)
+            logger.warning(f"{func.__name__} failed ({e!r}); retrying in {delay:.0f}s ({attempt}/{MAX_ATTEMPTS})")
+            await asyncio.sleep(delay)
+
 class GitHubService:
     """
     Service layer for GitHub API interactions.
     Wraps the existing functional implementation into a class-based service.
+
+    The wrapped functions share one pooled HTTP/2 client; use the service as an
+    async context manager to open it up front and close it when done. Transient
+    failures are retried with exponential backoff before being raised.
     """
-    
+
+    def __init__(self):
+        # Authenticated user per token (keyed by a token hash); the identity is stable for a token's lifetime
+        self._user_cache = {}
+
+    async def __aenter__(self):
+        get_client()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await close_client()
+
     async def authenticate_user(self, token: str):
-        """Verify the GitHub token and return user details."""
+        """Verify the GitHub token and return user details (cached per token)."""
+        key = hashlib.sha256(token.encode("utf-8")).hexdigest()
+        cached = self._user_cache.get(key)
+        if cached:
+            return cached
         try:
-            return await verify_access_token(token)
+            user = await _with_retry(verify_access_token, token)
         except Exception as e:
             logger.error(f"Authentication failed: {e}")
             raise
+        if user:
+            self._user_cache[key] = user
+        return user
 
     async def get_repositories(self, token: str):
         """Fetch all repositories for the authenticated user."""
         try:
-            return await get_user_repositories(token)
+            return await _with_retry(get_user_repositories, token)
         except Exception as e:
             logger.error(f"Failed to fetch repositories: {e}")
             raise
@@ -48,7 +113,7 @@ class GitHubService:
     async def get_repo_details(self, token: str, repo_id: int):
         """Fetch detailed information for a specific repository."""
         try:
-            return await get_repository_details(token, repo_id)
+            return await _with_retry(get_repository_details, token, repo_id)
         except Exception as e:
             logger.error(f"Failed to fetch details for repo {repo_id}: {e}")
             raise
@@ -56,7 +121,7 @@ class GitHubService:
     async def get_readme(self, token: str, full_name: str) -> str:
         """Fetch README content for a repository."""
         try:
-            content = await get_readme_content(token, full_name)
+            content = await _with_retry(get_readme_content, token, full_name)
             return content if content else ""
         except Exception as e:
             logger.warning(f"Failed to fetch README for {full_name}: {e}")
@@ -9,6 +9,14 @@ from services.ai_service import AIService
 
 logger = logging.getLogger(__name__)
 
+def _project_to_dict(project) -> dict:
+    """Extracts the metadata fields reported for a Project record."""
+    return {
+        "project_name": project.project_name,
+        "description": project.description,
+        "features": project.features
+    }
+
 class OrchestratorService:
     """
     Coordinates the entire workflow: GitHub -> DB -> Clone -> Scan -> Analyze -> AI -> Report.
@@ -21,6 +29,14 @@ class OrchestratorService:
         self.analysis_service = AnalysisService()
         self.ai_service = AIService()
 
+    async def __aenter__(self):
+        """Opens the shared GitHub client for the lifetime of the orchestrator."""
+        await self.github_service.__aenter__()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.github_service.__aexit__(exc_type, exc, tb)
+
     async def authenticate_and_get_repos(self, token: str):
         """
         Public method to authenticate and fetch repositories.
@@ -51,106 +67,103 @@ class OrchestratorService:
         logger.info(f"Starting report generation for Repo ID: {github_repo_id}")
         
         try:
-            # 1. Fetch Repository Details from GitHub
-            repo_details = await self.github_service.get_repo_details(token, github_repo_id)
+            # 1-2. Fetch Repository Details and User Info (for linkage) concurrently
+            repo_details, user_data = await asyncio.gather(
+                self.github_service.get_repo_details(token, github_repo_id),
+                self.github_service.authenticate_user(token),
+            )
             if not repo_details:
                 raise ValueError("Could not fetch repository details from GitHub.")
-
-            # 2. Get User Info for linkage
-            user_data = await self.github_service.authenticate_user(token)
             if not user_data:
                 raise ValueError("Authentication failed.")
             
-            # 3. DB: Ensure User & Repository exist
-            user = await self.repository_service.get_or_create_user(user_data, token)
-            repo = await self.repository_service.get_or_create_repository(repo_details, user.id)
-
-            # 4. Check if Project Analysis already exists in DB
-            # Note: We might want to force refresh, but per original logic we check first
-            existing_project = await self.repository_service.get_project_by_repo_id(repo.id)
+            # Short session for steps 3-4; committed before the slow clone/README/LLM work
+            async with self.repository_service.session_scope() as db:
+                # 3. DB: Ensure User & Repository exist
+                user = await self.repository_service.get_or_create_user(user_data, token, db=db)
+                repo = await self.repository_service.get_or_create_repository(repo_details, user.id, db=db)
+
+                # 4. Check if Project Analysis already exists in DB
+                # Note: We might want to force refresh, but per original logic we check first
+                existing_project = await self.repository_service.get_project_by_repo_id(repo.id, db=db)
             
             # 5. Clone Repository (Blocking -> Thread)
             repo_url = repo.repo_url
             repo_name = repo.name
             
-            # Run cloning in a thread to keep async loop responsive
-            repo_path = await asyncio.to_thread(
+            # Start cloning in a thread now; it overlaps with the README fetch and LLM call below
+            clone_task = asyncio.create_task(asyncio.to_thread(
                 self.clone_service.ensure_cloned, repo_url, token
-            )
+            ))
+
+            try:
+                # 6. Run Logic - Either fetch existing or generate new
             
+                project_metadata = {}
+                needs_ai_analysis = True
+
+                if existing_project:
+                    # Check if it has meaningful content
+                    desc = existing_project.get("description")
+                    feats = existing_project.get("features")
+                    if desc or (feats and len(feats) > 0):
+                        logger.info(f"Using existing project metadata for {repo_name}")
+                        project_metadata = existing_project
+                        needs_ai_analysis = False
+                    else:
+                        logger.info(f"Existing project metadata found but empty for {repo_name}. Regenerating AI analysis...")
+
+                project_id = None
+                if existing_project:
+                    project_id = existing_project.get("id")
+
+                if needs_ai_analysis:
+                    # 7. AI Analysis (README Parsing) - no session is held while waiting on GitHub or the LLM
+                    logger.info(f"Generating new AI analysis for {repo_name}...")
+                    readme_content = await self.github_service.get_readme(token, repo.full_name)
+                    extracted_data = await self.ai_service.parse_readme(readme_content)
+                
+                    # 8. Save new Project to DB
+                    # Merge extracted data with defaults
+                    project_data = {
+                        "project_name": extracted_data.get("project_name") or repo.name,
+                        "description": extracted_data.get("description", ""),
+                        "features": extracted_data.get("features", [])
+                    }
+                
+                    async with self.repository_service.session_scope() as db:
+                        if existing_project:
+                            # Update existing record
+                            new_project = await self.repository_service.update_project(repo.id, project_data, db=db)
+                            # If update fails or returns None, we still use the data locally
+                            if not new_project:
+                                 logger.warning("Failed to update project in DB, using local data.")
+                        else:
+                            # Create new record
+                            # Falls back to the local data if creation fails (should rarely happen)
+                            new_project = await self.repository_service.create_project(project_data, repo.id, user.id, db=db)
+
+                    if new_project:
+                        project_id = new_project.id
+                    project_metadata = _project_to_dict(new_project) if new_project else project_data
+
+                repo_path = await clone_task
+            finally:
+                # Never leave the clone task orphaned if anything above raised
+                if not clone_task.done():
+                    clone_task.cancel()
+                    await asyncio.gather(clone_task, return_exceptions=True)
+
             if not repo_path:
                 logger.error("Cloning failed. Analysis will be incomplete.")
 
-            # 6. Scan for Files (Blocking -> Thread)
+            # 9. Scan for Files (Blocking -> Thread)
             python_files = []
             if repo_path:
                 python_files = await asyncio.to_thread(
                     self.scanning_service.scan_for_python_files, repo_path
                 )
 
-            # 7. Run Logic - Either fetch existing or generate new
-            
-            project_metadata = {}
-            needs_ai_analysis = True
-
-            if existing_project:
-                # Check if it has meaningful content
-                desc = existing_project.get("description")
-                feats = existing_project.get("features")
-                if desc or (feats and len(feats) > 0):
-                    logger.info(f"Using existing project metadata for {repo_name}")
-                    project_metadata = existing_project
-                    needs_ai_analysis = False
-                else:
-                    logger.info(f"Existing project metadata found but empty for {repo_name}. Regenerating AI analysis...")
-
-            project_id = None
-            if existing_project:
-                project_id = existing_project.get("id")
-
-            if needs_ai_analysis:
-                # 8. AI Analysis (README Parsing)
-                logger.info(f"Generating new AI analysis for {repo_name}...")
-                readme_content = await self.github_service.get_readme(token, repo.full_name)
-                extracted_data = await self.ai_service.parse_readme(readme_content)
-                
-                # 9. Save new Project to DB
-                # Merge extracted data with defaults
-                project_data = {
-                    "project_name": extracted_data.get("project_name") or repo.name,
-                    "description": extracted_data.get("description", ""),
-                    "features": extracted_data.get("features", [])
-                }
-                
-                if existing_project:
-                    # Update existing record
-                    new_project = await self.repository_service.update_project(repo.id, project_data)
-                    # If update fails or returns None, we still use the data locally
-                    if not new_project:
-                         logger.warning("Failed to update project in DB, using local data.")
-                         # Construct a dict-like object or use dict directly
-                         project_metadata = project_data
-                    else:
-                        project_id = new_project.id
-                        project_metadata = {
-                            "project_name": new_project.project_name,
-                            "description": new_project.description,
-                            "features": new_project.features
-                        }
-                else:
-                    # Create new record
-                    new_project = await self.repository_service.create_project(project_data, repo.id, user.id)
-                    if new_project:
-                        project_id = new_project.id
-                        project_metadata = {
-                            "project_name": new_project.project_name,
-                            "description": new_project.description,
-                            "features": new_project.features
-                        }
-                    else:
-                        # Fallback if creation fails (should rarely happen)
-                        project_metadata = project_data
-
             # 10. Run Code Analysis (Blocking -> Thread)
             # We run this always to get fresh results on the checked-out code
             analysis_results = []
@@ -169,12 +182,12 @@ class OrchestratorService:
             if project_id:
                 try:
                     logger.info(f"Saving analysis results for Project ID: {project_id}")
-                    await self.repository_service.create_analysis_result(
-                        project_id=project_id,
-                        file_structure=file_structure,
-                        python_files=python_files,  # JSON-serializable list
-                        analysis_data=analysis_results # JSON-serializable list of dicts
-                    )
+                    await self.repository_service.bulk_create_analysis_results([{
+                        "project_id": project_id,
+                        "file_structure": file_structure,
+                        "python_files": python_files,  # JSON-serializable list
+                        "analysis_data": analysis_results # JSON-serializable list of dicts
+                    }])
                 except Exception as db_err:
                     logger.error(f"Failed to save analysis results to DB: {db_err}")
             else:
@@ -4,11 +4,19 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Set once sys.path has been configured; every service module calls setup_paths() on import
+_DONE = False
+
 def setup_paths():
     """
     Configures sys.path to include necessary sub-project directories.
     This ensures imports key modules from git-project-onboarding, Git-Repo-Analysis, and NexaTest works.
+    Only the first call does any work.
     """
+    global _DONE
+    if _DONE:
+        return
+
     project_root = os.getcwd()
     
     paths_to_add = [
@@ -18,8 +26,12 @@ def setup_paths():
         "Nexatest--FolderTreeStructure"
     ]
     
+    existing = set(sys.path)
     for path in paths_to_add:
         full_path = os.path.join(project_root, path)
-        if full_path not in sys.path:
+        if full_path not in existing:
             sys.path.append(full_path)
+            existing.add(full_path)
             # logger.debug(f"Added {full_path} to sys.path")
+
+    _DONE = True
@@ -1,5 +1,7 @@
 import logging
 import asyncio
+from contextlib import asynccontextmanager, contextmanager
+from sqlalchemy.dialects import postgresql, sqlite
 from services.path_manager import setup_paths
 
 # Setup paths before imports
@@ -25,6 +27,26 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Dialects whose INSERT supports ON CONFLICT ... RETURNING
+_UPSERT_INSERTS = {
+    "sqlite": sqlite.insert,
+    "postgresql": postgresql.insert,
+}
+
+# Set once the tables have been created in this process
+_SCHEMA_READY = False
+
+def _ensure_schema(log):
+    """Creates the database tables on first use; later calls return immediately."""
+    global _SCHEMA_READY
+    if _SCHEMA_READY or not (Base and engine):
+        return
+    try:
+        Base.metadata.create_all(bind=engine)
+        _SCHEMA_READY = True
+    except Exception as e:
+        log.error(f"Failed to create tables: {e}")
+
 class RepositoryService:
     """
     Manages database interactions for User, Repository, and Project entities.
@@ -32,73 +54,134 @@ class RepositoryService:
     """
     def __init__(self):
         self.log = logging.getLogger(__name__)
-        # Ensure tables exist
-        try:
-            if Base and engine:
-                Base.metadata.create_all(bind=engine)
-        except Exception as e:
-            self.log.error(f"Failed to create tables: {e}")
+        # Ensure tables exist (checked against the database once per process)
+        _ensure_schema(self.log)
 
-    def get_db(self):
+    def get_db(self, **session_options):
         """Yields a database session."""
         if not SessionLocal:
             raise RuntimeError("Database session factory is not configured.")
-        db = SessionLocal()
+        db = SessionLocal(**session_options)
         try:
             return db
         except Exception:
             db.close()
             raise
 
-    async def get_or_create_user(self, user_data: dict, token: str):
-        """Finds or creates a User in the database."""
-        db = self.get_db()
+    @asynccontextmanager
+    async def session_scope(self):
+        """
+        Provides one session for a sequence of calls, committed once at the end.
+
+        Pass the yielded session as `db` to the methods below; they then flush
+        instead of committing. Objects stay readable after the scope closes.
+        """
+        db = self.get_db(autoflush=False, expire_on_commit=False)
         try:
-            user = db.query(User).filter(User.github_id == user_data['id']).first()
+            yield db
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    @contextmanager
+    def _session(self, db=None):
+        """Uses the caller's session if given, otherwise a short-lived one committed on exit."""
+        if db is not None:
+            yield db
+            return
+        session = self.get_db(expire_on_commit=False)
+        try:
+            yield session
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
+    def _upsert(self, session, model, values: dict, conflict_column: str, update_columns: tuple):
+        """
+        Inserts a row or updates the existing one in a single statement.
+
+        Args:
+            session: The active database session.
+            model: The ORM class to upsert into.
+            values (dict): Column values for the new row.
+            conflict_column (str): The unique column identifying an existing row.
+            update_columns (tuple): Columns overwritten when the row already exists.
+
+        Returns:
+            The persisted ORM instance, or None if the dialect has no upsert.
+        """
+        insert = _UPSERT_INSERTS.get(session.get_bind().dialect.name)
+        if insert is None:
+            return None
+        stmt = insert(model).values(**values)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[conflict_column],
+            set_={column: stmt.excluded[column] for column in update_columns},
+        ).returning(model)
+        return session.execute(
+            stmt, execution_options={"populate_existing": True}
+        ).scalar_one()
+
+    async def get_or_create_user(self, user_data: dict, token: str, db=None):
+        """Finds or creates a User in the database, storing the latest access token."""
+        values = {
+            "github_id": user_data['id'],
+            "github_username": user_data['login'],
+            "github_email": user_data.get('email'),
+            "github_access_token": token,
+        }
+        with self._session(db) as session:
+            user = self._upsert(session, User, values, "github_id", ("github_access_token",))
+            if user is not None:
+                return user
+
+            user = session.query(User).filter(User.github_id == user_data['id']).first()
             if not user:
                 self.log.info(f"Creating new user: {user_data.get('login')}")
-                user = User(
-                    github_id=user_data['id'],
-                    github_username=user_data['login'],
-                    github_email=user_data.get('email'),
-                    github_access_token=token
-                )
-                db.add(user)
-                db.commit()
-                db.refresh(user)
+                user = User(**values)
+                session.add(user)
+                session.flush()
             return user
-        finally:
-            db.close()
 
-    async def get_or_create_repository(self, repo_data: dict, user_id: int):
+    async def get_or_create_repository(self, repo_data: dict, user_id: int, db=None):
         """Finds or creates a Repository in the database linked to a User."""
-        db = self.get_db()
-        try:
-            repo = db.query(Repository).filter(Repository.github_repo_id == repo_data['id']).first()
+        values = {
+            "github_repo_id": repo_data['id'],
+            "name": repo_data['name'],
+            "full_name": repo_data['full_name'],
+            "repo_url": repo_data['html_url'],
+            "is_private": repo_data['private'],
+            "default_branch": repo_data.get('default_branch', 'main'),
+            "owner_name": repo_data['owner']['login'],
+            "connected_by_user_id": user_id,
+        }
+        with self._session(db) as session:
+            # Existing rows keep their connecting user but pick up renames from GitHub
+            repo = self._upsert(
+                session, Repository, values, "github_repo_id",
+                ("name", "full_name", "repo_url", "is_private", "default_branch", "owner_name"),
+            )
+            if repo is not None:
+                return repo
+
+            repo = session.query(Repository).filter(Repository.github_repo_id == repo_data['id']).first()
             if not repo:
                 self.log.info(f"Connecting repository: {repo_data.get('full_name')}")
-                repo = Repository(
-                    github_repo_id=repo_data['id'],
-                    name=repo_data['name'],
-                    full_name=repo_data['full_name'],
-                    repo_url=repo_data['html_url'],
-                    is_private=repo_data['private'],
-                    default_branch=repo_data.get('default_branch', 'main'),
-                    owner_name=repo_data['owner']['login'],
-                    connected_by_user_id=user_id
-                )
-                db.add(repo)
-                db.commit()
-                db.refresh(repo)
+                repo = Repository(**values)
+                session.add(repo)
+                session.flush()
             return repo
-        finally:
-            db.close()
 
-    async def get_project_by_repo_id(self, repo_id: int):
+    async def get_project_by_repo_id(self, repo_id: int, db=None):
         """Retrieve existing project for a repository ID."""
-        db = self.get_db()
-        try:
-            project = db.query(Project).filter(Project.repository_id == repo_id).first()
+        with self._session(db) as session:
+            project = session.query(Project).filter(Project.repository_id == repo_id).first()
             if project:
                 return {
                     "id": project.id,
@@ -109,14 +192,11 @@ class RepositoryService:
                     # handled by analysis logic or regenerated. Keeping it consistent.
                 }
             return None
-        finally:
-            db.close()
 
-    async def update_project(self, repo_id: int, project_data: dict):
+    async def update_project(self, repo_id: int, project_data: dict, db=None):
         """Updates an existing project with new metadata."""
-        db = self.get_db()
-        try:
-            project = db.query(Project).filter(Project.repository_id == repo_id).first()
+        with self._session(db) as session:
+            project = session.query(Project).filter(Project.repository_id == repo_id).first()
             if project:
                 if project_data.get("project_name"):
                     project.project_name = project_data["project_name"]
@@ -124,34 +204,28 @@ class RepositoryService:
                     project.description = project_data["description"]
                 if project_data.get("features") is not None:
                     project.features = project_data["features"]
-                db.commit()
-                db.refresh(project)
+                session.flush()
                 return project
             return None
-        finally:
-            db.close()
 
-    async def create_project(self, project_data: dict, repo_id: int, user_id: int):
+    async def create_project(self, project_data: dict, repo_id: int, user_id: int, db=None):
         """Creates a new Project record."""
-        db = self.get_db()
         try:
-            new_project = Project(
-                project_name=project_data.get("project_name", "Untitled"),
-                description=project_data.get("description", ""),
-                features=project_data.get("features", []),
-                repository_id=repo_id,
-                created_by=user_id
-            )
-            db.add(new_project)
-            db.commit()
-            db.refresh(new_project)
-            return new_project
+            with self._session(db) as session:
+                new_project = Project(
+                    project_name=project_data.get("project_name", "Untitled"),
+                    description=project_data.get("description", ""),
+                    features=project_data.get("features", []),
+                    repository_id=repo_id,
+                    created_by=user_id
+                )
+                # A savepoint keeps a failure here from undoing the rest of a shared session
+                with session.begin_nested():
+                    session.add(new_project)
+                return new_project
         except Exception as e:
-            db.rollback()
             self.log.error(f"Failed to create project: {e}")
             return None
-        finally:
-            db.close()
 
     async def create_analysis_result(self, project_id: int, file_structure: str, python_files: list, analysis_data: list):
         """Creates a new AnalysisResult record linked to a Project."""
@@ -174,6 +248,26 @@ class RepositoryService:
         finally:
             db.close()
             
+    async def bulk_create_analysis_results(self, rows: list) -> int:
+        """
+        Inserts several AnalysisResult records in one batch and one commit.
+
+        Args:
+            rows (list): Dicts with project_id, file_structure, python_files and analysis_data.
+
+        Returns:
+            int: Number of rows written (0 on failure).
+        """
+        if not rows:
+            return 0
+        try:
+            with self._session() as session:
+                session.bulk_insert_mappings(AnalysisResult, rows)
+            return len(rows)
+        except Exception as e:
+            self.log.error(f"Failed to create analysis results: {e}")
+            return 0
+
     async def get_latest_analysis_result(self, project_id: int):
         """Retrieves the most recent analysis result for a project."""
         db = self.get_db()
@@ -1,20 +1,13 @@
 import logging
 import asyncio
+import os
 from pathlib import Path
-from typing import Union
+from typing import Iterator, Union
 from services.path_manager import setup_paths
 
 # Ensure paths before specific module import
 setup_paths()
 
-try:
-    from ai_code_review.scanner.directory_scanner import DirectoryScanner
-    from ai_code_review.scanner.file_collector import FileCollector
-except ImportError:
-    logging.warning("DirectoryScanner/FileCollector could not be imported.")
-    DirectoryScanner = None
-    FileCollector = None
-
 try:
     from app.utils.folder_tree.manager import generate_tree_structure_from_path
 except ImportError as e:
@@ -24,6 +17,35 @@ except ImportError as e:
 
 logger = logging.getLogger(__name__)
 
+# Directories that never contain project sources worth analysing
+SKIP_DIRS = frozenset({'.git', 'node_modules', '.venv', 'venv', '__pycache__', 'dist', 'build'})
+
+def _fast_py_walk(root: str) -> Iterator[str]:
+    """
+    Yields the paths of .py files under root in a single os.scandir pass.
+
+    Directories in SKIP_DIRS are not entered and symlinked directories are not
+    followed. Files come out in the same top-down order as os.walk.
+    """
+    stack = [root]
+    while stack:
+        path = stack.pop()
+        try:
+            with os.scandir(path) as it:
+                entries = list(it)
+        except OSError as e:
+            logger.warning(f"Skipping unreadable directory {path}: {e}")
+            continue
+
+        subdirs = []
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in SKIP_DIRS:
+                    subdirs.append(entry.path)
+            elif entry.name.endswith('.py'):
+                yield entry.path
+        stack.extend(reversed(subdirs))
+
 class ScanningService:
     """
     Manages scanning of cloned repositories for file discovery.
@@ -39,18 +61,8 @@ class ScanningService:
         """
         Scans a repository path for all .py files.
         """
-        if not DirectoryScanner or not FileCollector:
-            logger.warning("Scanner components missing. Returning empty list.")
-            return []
-            
         try:
-            ds = DirectoryScanner(repo_path)
-            scan_data = ds.scan()
-            fc = FileCollector(scan_data["all_files"])
-            code_files = fc.get_code_files()
-            
-            # Filter strictly for python files
-            python_files = [f for f in code_files if f.endswith('.py')]
+            python_files = list(_fast_py_walk(repo_path))
             logger.info(f"Found {len(python_files)} Python files in {repo_path}")
             return python_files
             
@@ -1,113 +1,377 @@
+import functools
 import sqlite3
-import json
 import os
+import re
+import sys
+
+try:
+    from orjson import loads as _jloads
+except ImportError:
+    from json import loads as _jloads
 
 DB_FILE = "sql_app.db"
 
-def inspect_db():
-    if not os.path.exists(DB_FILE):
-        print(f"❌ Database file '{DB_FILE}' not found!")
-        return
+# Queries are module constants so repeated inspect_db() calls hit the connection's statement cache
+_Q_COUNTS = (
+    "SELECT (SELECT count(*) FROM users), (SELECT count(*) FROM repositories), "
+    "(SELECT count(*) FROM projects), (SELECT count(*) FROM analysis_results)"
+)
+_Q_HAS_STATS = "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'sqlite_stat1'"
+_Q_STAT_ROWS = "SELECT stat FROM sqlite_stat1 WHERE tbl = ? LIMIT 1"
+_Q_USERS_ROWS = "SELECT id, github_username, github_email FROM users LIMIT 5"
+_Q_REPOS_ROWS = "SELECT id, name, full_name, repo_url FROM repositories LIMIT 5"
+_Q_PROJECTS_ROWS = "SELECT id, project_name, description, features FROM projects LIMIT 5"
+# analysis_results is read in two passes: the ordering pass touches only small columns
+# (and can walk ix_analysis_results_created_at), then each row's JSON columns are fetched by id.
+_Q_ANALYSIS_ORDER = "SELECT id, project_id, created_at FROM analysis_results ORDER BY created_at DESC"
+# Array lengths and the few sampled elements are computed by SQLite's JSON1 functions, so the
+# (potentially multi-MB) python_files / analysis_data blobs never reach Python. Values that are
+# not a JSON array (malformed text, JSON null, ...) come back as raw text / length for display.
+_IS_ARRAY = "CASE WHEN json_valid({col}) THEN json_type({col}) = 'array' END"
+_Q_ANALYSIS_DETAIL = """
+    SELECT CASE WHEN {py_array} THEN json_array_length(python_files) END,
+           CASE WHEN {py_array} THEN json_extract(python_files, '$[0]', '$[1]', '$[2]') END,
+           CASE WHEN {py_array} THEN NULL ELSE python_files END,
+           CASE WHEN {analysis_array} THEN json_array_length(analysis_data) END,
+           CASE WHEN {analysis_array} THEN json_extract(analysis_data, '$[0]') END,
+           length(analysis_data)
+    FROM analysis_results WHERE id = ?
+""".format(
+    py_array=_IS_ARRAY.format(col="python_files"),
+    analysis_array=_IS_ARRAY.format(col="analysis_data"),
+)
+# Fallback for SQLite builds without JSON1
+_Q_ANALYSIS_RAW = "SELECT python_files, analysis_data FROM analysis_results WHERE id = ?"
 
-    print(f"✅ Inspecting Database: {DB_FILE}\n")
-    conn = sqlite3.connect(DB_FILE)
-    cursor = conn.cursor()
+def _connect(db_file):
+    conn = sqlite3.connect(db_file, cached_statements=128)
+    # Plain tuples: every loop below unpacks rows positionally
+    conn.row_factory = None
+    # Read-only inspection: refuse writes and serve page reads from a memory map
+    conn.execute("PRAGMA query_only=1")
+    conn.execute("PRAGMA mmap_size=268435456")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    return conn
+
+# One connection per database file, kept open and reused across inspect_db() calls
+_get_connection = functools.lru_cache(maxsize=None)(_connect)
+
+# db_file -> (file signature, in-memory copy) for inspect_db(in_memory=True)
+_SNAPSHOTS = {}
+
+def _file_signature(db_file):
+    # mtime and size of the database and its WAL; writes in WAL mode may only touch the -wal file
+    signature = []
+    for path in (db_file, db_file + "-wal"):
+        try:
+            st = os.stat(path)
+            signature.append((st.st_mtime_ns, st.st_size))
+        except FileNotFoundError:
+            signature.append(None)
+    return tuple(signature)
+
+def _get_snapshot(db_file):
+    # In-memory copy of the database, re-copied only when the file on disk has changed
+    signature = _file_signature(db_file)
+    cached = _SNAPSHOTS.get(db_file)
+    if cached and cached[0] == signature:
+        return cached[1]
+    ram = cached[1] if cached else sqlite3.connect(":memory:", cached_statements=128)
+    _get_connection(db_file).backup(ram)
+    _SNAPSHOTS[db_file] = (signature, ram)
+    return ram
+
+# JSON strings and structural characters; everything else (numbers, literals, whitespace) is skipped
+_JSON_TOKEN_RE = re.compile(r'"(?:[^"\\]|\\.)*"|[\[\]{},]')
+
+def _json_array_len(text):
+    # Counts the top-level elements of a JSON array without building it.
+    # Returns None if text is not an array.
+    text = text.strip()
+    if not (text.startswith("[") and text.endswith("]")):
+        return None
+    if not text[1:-1].strip():
+        return 0
+
+    depth = 0
+    commas = 0
+    for match in _JSON_TOKEN_RE.finditer(text):
+        token = match.group()
+        if token in "[{":
+            depth += 1
+        elif token in "]}":
+            depth -= 1
+            if depth == 0 and match.end() != len(text):
+                return None
+        elif token == "," and depth == 1:
+            commas += 1
+    return commas + 1 if depth == 0 else None
+
+def _json_array_head(text, n):
+    # The first n elements of a JSON array of strings, parsed from the front of the text only.
+    # Returns None if an element among them is not a string.
+    head = []
+    pos = text.index("[") + 1
+    for match in _JSON_TOKEN_RE.finditer(text, pos):
+        if len(head) == n:
+            break
+        token = match.group()
+        # Anything between tokens other than whitespace is a number or literal element
+        if text[pos:match.start()].strip() or token in "[{":
+            return None
+        if token.startswith('"'):
+            head.append(_jloads(token))
+        elif token == "]":
+            break
+        pos = match.end()
+    return head if len(head) == n else None
 
-    # 1. Check Users
-    print("--- Users Table ---")
+def _analysis_detail_raw(cursor, aid):
+    # Same result as _Q_ANALYSIS_DETAIL, for SQLite builds without the JSON1 functions
+    cursor.execute(_Q_ANALYSIS_RAW, (aid,))
+    py_files_raw, analysis_raw = cursor.fetchone()
+
+    py_count = _json_array_len(py_files_raw) if py_files_raw else None
+    py_sample = None
+    if py_count is not None:
+        py_sample = _json_array_head(py_files_raw, min(py_count, 3))
+        if py_sample is None:
+            # Non-string entries: fall back to a full parse for the sample
+            try:
+                py_sample = _jloads(py_files_raw)[:3]
+            except (ValueError, TypeError):
+                py_count = None
+    if py_count is not None:
+        py_files_raw = None
+
+    analysis_count = first_item = None
     try:
-        cursor.execute("SELECT count(*) FROM users")
+        analysis = _jloads(analysis_raw) if analysis_raw else None
+    except (ValueError, TypeError):
+        analysis = None
+    if isinstance(analysis, list):
+        analysis_count = len(analysis)
+        first_item = analysis[0] if analysis else None
+    analysis_len = len(analysis_raw) if analysis_raw is not None else None
+    return py_count, py_sample, py_files_raw, analysis_count, first_item, analysis_len
+
+@functools.lru_cache(maxsize=256)
+def _analysis_detail(source, aid, created):
+    # analysis_results rows are written once and never updated, so (id, created_at) identifies
+    # the content; repeat inspections skip the JSON work for rows already seen.
+    # source is a database path (read through its shared connection) or a snapshot connection.
+    conn = source if isinstance(source, sqlite3.Connection) else _get_connection(source)
+    cursor = conn.cursor()
+    try:
+        try:
+            cursor.execute(_Q_ANALYSIS_DETAIL, (aid,))
+            py_count, py_head, py_files_raw, analysis_count, first_item, analysis_len = cursor.fetchone()
+            py_sample = _jloads(py_head)[:min(py_count, 3)] if py_count is not None else None
+            # json_extract returns objects as JSON text
+            parse_first = _jloads
+        except sqlite3.OperationalError:
+            # No JSON1 (e.g. "no such function: json_valid"): scan the raw text instead
+            py_count, py_sample, py_files_raw, analysis_count, first_item, analysis_len = _analysis_detail_raw(cursor, aid)
+            parse_first = None
+    finally:
+        cursor.close()
+
+    sample_keys = None
+    if first_item is not None:
+        try:
+            sample_keys = list((parse_first(first_item) if parse_first else first_item).keys())
+        except (ValueError, TypeError, AttributeError):
+            # Not JSON, or the first entry isn't an object
+            pass
+    return py_count, py_sample, py_files_raw, analysis_count, first_item is not None, sample_keys, analysis_len
+
+def _table_count(cursor, table, count):
+    # Falls back to a per-table query when the combined count probe failed
+    if count is None:
+        cursor.execute(f"SELECT count(*) FROM {table}")
         count = cursor.fetchone()[0]
-        print(f"Total Users: {count}")
+    return count
+
+def _approx_count(cursor, table, has_stats):
+    # Row estimate from ANALYZE statistics ("<nrows> ..."), else the highest rowid;
+    # both avoid scanning the table but ignore deleted rows / stale stats
+    try:
+        if has_stats:
+            cursor.execute(_Q_STAT_ROWS, (table,))
+            row = cursor.fetchone()
+            if row:
+                return int(row[0].split()[0])
+        cursor.execute(f"SELECT coalesce(max(rowid), 0) FROM {table}")
+        return cursor.fetchone()[0]
+    except sqlite3.OperationalError:
+        # Missing table: leave it to the section to report the error
+        return None
+
+def _write_lines(out):
+    # One stdout write per batch of lines instead of one print() per line
+    if out:
+        sys.stdout.write("\n".join(out) + "\n")
+        out.clear()
+
+def _users_section(conn, count, approx):
+    out = ["--- Users Table ---"]
+    cursor = conn.cursor()
+    try:
+        count = _table_count(cursor, "users", count)
+        out.append(f"Total Users{approx}: {count}")
         
-        cursor.execute("SELECT id, github_username, github_email FROM users LIMIT 5")
-        rows = cursor.fetchall()
-        for row in rows:
-            print(f"  ID: {row[0]} | Username: {row[1]} | Email: {row[2]}")
+        cursor.execute(_Q_USERS_ROWS)
+        for uid, username, email in cursor:
+            out.append(f"  ID: {uid} | Username: {username} | Email: {email}")
     except sqlite3.OperationalError as e:
-        print(f"❌ Error querying users table: {e}")
+        out.append(f"❌ Error querying users table: {e}")
+    finally:
+        cursor.close()
+    return out
 
-    # 2. Check Repositories
-    print("\n--- Repositories Table ---")
+def _repositories_section(conn, count, approx):
+    out = ["\n--- Repositories Table ---"]
+    cursor = conn.cursor()
     try:
-        cursor.execute("SELECT count(*) FROM repositories")
-        count = cursor.fetchone()[0]
-        print(f"Total Repositories: {count}")
+        count = _table_count(cursor, "repositories", count)
+        out.append(f"Total Repositories{approx}: {count}")
         
-        cursor.execute("SELECT id, name, full_name, repo_url FROM repositories LIMIT 5")
-        rows = cursor.fetchall()
-        for row in rows:
-            print(f"  ID: {row[0]} | Name: {row[1]} | Full Name: {row[2]}")
+        cursor.execute(_Q_REPOS_ROWS)
+        for rid, name, full_name, _repo_url in cursor:
+            out.append(f"  ID: {rid} | Name: {name} | Full Name: {full_name}")
     except sqlite3.OperationalError as e:
-        print(f"❌ Error querying repositories table: {e}")
+        out.append(f"❌ Error querying repositories table: {e}")
+    finally:
+        cursor.close()
+    return out
 
-    # 3. Check Projects
-    print("\n--- Projects Table ---")
+def _projects_section(conn, count, approx):
+    out = ["\n--- Projects Table ---"]
+    cursor = conn.cursor()
     try:
-        cursor.execute("SELECT count(*) FROM projects")
-        count = cursor.fetchone()[0]
-        print(f"Total Projects: {count}")
+        count = _table_count(cursor, "projects", count)
+        out.append(f"Total Projects{approx}: {count}")
         
-        cursor.execute("SELECT id, project_name, description, features FROM projects LIMIT 5")
-        rows = cursor.fetchall()
-        for row in rows:
-            pid, name, desc, features_json = row
-            try:
-                features = json.loads(features_json) if features_json else []
-            except:
-                features = features_json
+        cursor.execute(_Q_PROJECTS_ROWS)
+        for pid, name, desc, features_json in cursor:
+            if not features_json:
+                features = []
+            else:
+                try:
+                    features = _jloads(features_json)
+                except (ValueError, TypeError):
+                    features = features_json
                 
-            print(f"  ID: {pid}")
-            print(f"  Project Name: {name}")
-            print(f"  Description: {desc[:100]}..." if desc and len(desc) > 100 else f"  Description: {desc}")
-            print(f"  Features Type in DB: {type(features_json)}")
-            print(f"  Parsed Features: {features}")
-            print("-" * 20)
+            out.append(f"  ID: {pid}")
+            out.append(f"  Project Name: {name}")
+            suffix = "..." if desc and len(desc) > 100 else ""
+            out.append(f"  Description: {desc[:100] if desc else desc}{suffix}")
+            out.append(f"  Features Type in DB: {type(features_json)}")
+            out.append(f"  Parsed Features: {features}")
+            out.append("-" * 20)
             
     except sqlite3.OperationalError as e:
-        print(f"❌ Error querying projects table: {e}")
+        out.append(f"❌ Error querying projects table: {e}")
+    finally:
+        cursor.close()
+    return out
+
+def inspect_db(show_analysis: bool = True, approximate_counts: bool = False, in_memory: bool = False):
+    """
+    Prints a summary of the users, repositories, projects and (optionally)
+    analysis_results tables in DB_FILE.
+
+    Args:
+        show_analysis (bool): Include the analysis_results section.
+        approximate_counts (bool): Estimate table sizes from sqlite_stat1 or
+            max(rowid) instead of counting rows (faster on large tables).
+        in_memory (bool): Query an in-memory copy of the database, refreshed
+            only when the file changes (for repeated inspections).
+    """
+    if not os.path.exists(DB_FILE):
+        print(f"❌ Database file '{DB_FILE}' not found!")
+        return
+
+    print(f"✅ Inspecting Database: {DB_FILE}\n")
+    conn = _get_snapshot(DB_FILE) if in_memory else _get_connection(DB_FILE)
+    cursor = conn.cursor()
+
+    if approximate_counts:
+        has_stats = cursor.execute(_Q_HAS_STATS).fetchone() is not None
+        user_ct, repo_ct, proj_ct, ana_ct = (
+            _approx_count(cursor, table, has_stats)
+            for table in ("users", "repositories", "projects", "analysis_results")
+        )
+        approx = " (approx.)"
+    else:
+        approx = ""
+        # Row counts for all four tables in one round trip
+        try:
+            cursor.execute(_Q_COUNTS)
+            user_ct, repo_ct, proj_ct, ana_ct = cursor.fetchone()
+        except sqlite3.OperationalError:
+            # A missing table fails the whole probe; each section then reports its own error
+            user_ct = repo_ct = proj_ct = ana_ct = None
+
+    detail_source = conn if in_memory else DB_FILE
 
-    # 4. Check Analysis Results
-    print("\n--- Analysis Results Table ---")
     try:
-        cursor.execute("SELECT count(*) FROM analysis_results")
-        count = cursor.fetchone()[0]
-        print(f"Total Analysis Results: {count}")
-        
-        cursor.execute("SELECT id, project_id, created_at, python_files, analysis_data FROM analysis_results ORDER BY created_at DESC")
-        rows = cursor.fetchall()
-        
-        for row in rows:
-            aid, pid, created, py_files_raw, analysis_raw = row
-            print(f"\n  Analysis ID: {aid}")
-            print(f"  Project ID: {pid}")
-            print(f"  Created At: {created}")
+        # 1-3. Users, Repositories and Projects
+        _write_lines(_users_section(conn, user_ct, approx))
+        _write_lines(_repositories_section(conn, repo_ct, approx))
+        _write_lines(_projects_section(conn, proj_ct, approx))
+
+        # 4. Check Analysis Results
+        if not show_analysis:
+            return
+
+        out = ["\n--- Analysis Results Table ---"]
+        try:
+            count = _table_count(cursor, "analysis_results", ana_ct)
+            out.append(f"Total Analysis Results{approx}: {count}")
             
-            try:
-                py_files = json.loads(py_files_raw) if py_files_raw else []
-                print(f"  Python Files Found: {len(py_files)}")
-                # Show first 3 files
-                for f in py_files[:3]:
-                    print(f"    - {f}")
-                if len(py_files) > 3:
-                    print(f"    - ... ({len(py_files)-3} more)")
-            except:
-                print(f"  Python Files raw: {py_files_raw}")
+            cursor.execute(_Q_ANALYSIS_ORDER)
 
-            try:
-                analysis = json.loads(analysis_raw) if analysis_raw else []
-                print(f"  Analysis Entries: {len(analysis)}")
-                if analysis:
-                    print(f"  Sample Analysis Item Keys: {list(analysis[0].keys())}")
-            except:
-                print(f"  Analysis Data raw len: {len(str(analysis_raw))}")
-            print("-" * 30)
+            # Rows stream from the cursor; each row's counts and small samples are fetched by id inline
+            for aid, pid, created in cursor:
+                (py_count, py_sample, py_files_raw, analysis_count,
+                 has_first_item, sample_keys, analysis_len) = _analysis_detail(detail_source, aid, created)
+                out.append(f"\n  Analysis ID: {aid}")
+                out.append(f"  Project ID: {pid}")
+                out.append(f"  Created At: {created}")
+                
+                if py_count is not None:
+                    out.append(f"  Python Files Found: {py_count}")
+                    # Show first 3 files
+                    for f in py_sample:
+                        out.append(f"    - {f}")
+                    if py_count > 3:
+                        out.append(f"    - ... ({py_count-3} more)")
+                elif py_files_raw:
+                    out.append(f"  Python Files raw: {py_files_raw}")
+                else:
+                    out.append("  Python Files Found: 0")
 
-    except sqlite3.OperationalError as e:
-        print(f"❌ Error querying analysis_results table: {e}")
-        print("Note: If this table is missing, run the pipeline once to create it.")
+                if analysis_count is not None or not analysis_len:
+                    out.append(f"  Analysis Entries: {analysis_count or 0}")
+                    if sample_keys is not None:
+                        out.append(f"  Sample Analysis Item Keys: {sample_keys}")
+                    elif has_first_item:
+                        out.append(f"  Analysis Data raw len: {analysis_len}")
+                else:
+                    out.append(f"  Analysis Data raw len: {analysis_len}")
+                out.append("-" * 30)
+                _write_lines(out)
+
+        except sqlite3.OperationalError as e:
+            out.append(f"❌ Error querying analysis_results table: {e}")
+            out.append("Note: If this table is missing, run the pipeline once to create it.")
+        _write_lines(out)
+    finally:
+        cursor.close()
 
-    conn.close()
+# Users, repositories and projects only
+inspect_basic = functools.partial(inspect_db, show_analysis=False)
 
 if __name__ == "__main__":
     inspect_db()